@@ -28,28 +28,62 @@ Submission Requirements:
 from __future__ import annotations
 
 import csv
+import json
+import logging
 import os
-from collections import deque
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from datetime import date, datetime
-from functools import cache, wraps
-from io import TextIOWrapper
+from functools import cache
+from io import BufferedReader, BytesIO, RawIOBase
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Any, Callable
+from queue import Queue
+from threading import Event, Thread
+from typing import IO, TYPE_CHECKING
 
+import pyarrow
+import pyarrow.compute
+import pyarrow.csv
 import sob
 
 from cms_gov_provider_data_sdk.client import Client
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Mapping, Sequence
+    from email.message import Message
     from http.client import HTTPResponse
 
     from cms_gov_provider_data_sdk.model import Dataset, DatasetDistribution
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 DATA: Path = Path(__file__).parent / "data"
 ECHO: bool = False
 DUMMY_END_DATE: date = date(1900, 1, 1)
+# The number of bytes read (and parsed) from a CSV at a time
+CSV_BLOCK_SIZE: int = 8 << 20
+# The number of bytes buffered before writing to an output CSV, and the
+# number of rows formatted at a time
+CSV_WRITE_BUFFER_SIZE: int = 4 << 20
+CSV_WRITE_BATCH_SIZE: int = 1 << 16
+# Datasets larger than this many bytes are downloaded in parallel byte
+# ranges, when the server supports range requests
+RANGE_DOWNLOAD_THRESHOLD: int = 32 << 20
+RANGE_DOWNLOAD_PARTS: int = 8
+# Streamed downloads are read ahead, in a background thread, in chunks of
+# this many bytes, up to this many chunks ahead of the CSV parser
+READ_AHEAD_CHUNK_SIZE: int = 1 << 20
+READ_AHEAD_CHUNKS: int = 8
+# The maximum number of datasets downloaded concurrently, when using threads
+MAX_DOWNLOAD_THREADS: int = 16
+# The cache validators for each download are stored in this file, in the
+# root data directory, so that unmodified datasets can be skipped
+SYNC_STATE_FILE_NAME: str = ".sync_state.json"
 
 
 @cache
@@ -60,6 +94,15 @@ def get_client() -> Client:
     return Client(echo=ECHO)
 
 
+@cache
+def get_column_name(header: str) -> str:
+    """
+    Get a snake_case column name for a CSV header. Results are cached, as
+    many of the hospital datasets share the same column headers.
+    """
+    return sob.utilities.get_property_name(header)
+
+
 def iter_hospital_dataset_identifier_download_url(
     client: Client | None = None,
 ) -> Iterable[tuple[str, str]]:
@@ -86,55 +129,143 @@ def iter_hospital_dataset_identifier_download_url(
                     yield dataset.identifier, distribution.download_url
 
 
-def iter_csv(
-    csv_bytes_io: IO[bytes],
-    end_dates: set,
-    after: date | None = None,
-) -> Iterable[tuple[Any, ...]]:
+def read_csv_header(csv_bytes_io: IO[bytes]) -> list[str]:
     """
-    Iterate over rows in a CSV file
+    Read the header of a CSV file, leaving the stream positioned at the
+    start of the first data row. Empty lines preceding the header are
+    skipped, and an empty list is returned if the stream has no header.
 
     Parameters:
         csv_bytes_io: An IO stream containing the CSV data.
-        end_dates: A set to collect unique end dates from the CSV.
-        after: If provided, only yield rows with an end date after this date.
     """
-    csv_io: IO[str] = TextIOWrapper(
-        csv_bytes_io,
+    # Lines are only read as needed to parse the first record, which spans
+    # multiple lines if a quoted column name contains a line break
+    lines: Iterable[str] = (
+        str(line, encoding="utf-8-sig")
+        for line in iter(csv_bytes_io.readline, b"")
     )
-    reader: csv._reader = csv.reader(csv_io)
+    header: list[str]
+    for header in csv.reader(lines):
+        if header:
+            return header
+    return []
+
+
+def open_csv(csv_bytes_io: IO[bytes]) -> pyarrow.RecordBatchReader:
+    """
+    Open a streaming reader for a CSV file, with snake_case column names
+
+    Parameters:
+        csv_bytes_io: An IO stream containing the CSV data.
+    """
     # snake_case the column names
-    columns: tuple[str, ...] = tuple(
-        map(sob.utilities.get_property_name, next(reader))
+    columns: list[str] = list(
+        map(get_column_name, read_csv_header(csv_bytes_io))
+    )
+    schema: pyarrow.Schema = pyarrow.schema(
+        (column, pyarrow.string()) for column in columns
     )
-    yield columns
-    end_date_index: int | None = None
+    if not columns:
+        # A CSV file without a header is an empty dataset
+        return pyarrow.RecordBatchReader.from_batches(schema, ())
+    try:
+        # The header has already been read, so we provide the (snake_case)
+        # column names, and read all values as text to prevent type
+        # inference from altering values such as ZIP codes and facility IDs
+        return pyarrow.csv.open_csv(
+            csv_bytes_io,
+            read_options=pyarrow.csv.ReadOptions(
+                column_names=columns,
+                block_size=CSV_BLOCK_SIZE,
+            ),
+            convert_options=pyarrow.csv.ConvertOptions(
+                column_types=dict(zip(schema.names, schema.types)),
+            ),
+        )
+    except pyarrow.ArrowInvalid as error:
+        # A header without any rows following it is an empty dataset
+        if "Empty CSV file" not in str(error):
+            raise
+        return pyarrow.RecordBatchReader.from_batches(schema, ())
+
+
+def get_end_date_index(column_names: Sequence[str]) -> int | None:
+    """
+    Get the index of the end date column: the column named "end_date", if
+    there is one, otherwise the last column name ending with "end_date", or
+    `None` if no column names end with "end_date".
+    """
+    if "end_date" in column_names:
+        return column_names.index("end_date")
     index: int
-    for index, column in enumerate(columns):
-        if column.endswith("end_date"):
-            end_date_index = index
-            if column == "end_date":
-                # Only stop looking if we found an exact match
-                break
+    column_name: str
+    suffix_indices: list[int] = [
+        index
+        for index, column_name in enumerate(column_names)
+        if column_name.endswith("end_date")
+    ]
+    return suffix_indices[-1] if suffix_indices else None
+
+
+def iter_csv(
+    reader: pyarrow.RecordBatchReader,
+    end_dates: set,
+    after: date | None = None,
+) -> Iterable[pyarrow.RecordBatch]:
+    """
+    Iterate over record batches in a CSV file
+
+    Parameters:
+        reader: A streaming CSV reader, as returned by `open_csv`.
+        end_dates: A set to collect unique end dates from the CSV.
+        after: If provided, only yield rows with an end date after this date.
+    """
+    end_date_index: int | None = get_end_date_index(reader.schema.names)
     if end_date_index is None:
         # Add a dummy end date to indicate no end dates are in this dataset
         end_dates.add(DUMMY_END_DATE)
-    row: tuple
-    for row in reader:
-        end_date: date | None = None
-        if end_date_index and row[end_date_index]:
-            end_date = datetime.strptime(  # noqa: DTZ007
-                row[end_date_index], "%m/%d/%Y"
-            ).date()
-            end_dates.add(end_date)
-        # Yield rows with an end date after the indicated `after` date
-        if (
-            end_date_index is None
-            or after is None
-            or end_date is None
-            or end_date > after
-        ):
-            yield row
+    after_scalar: pyarrow.Scalar | None = (
+        None if after is None else pyarrow.scalar(after, pyarrow.date32())
+    )
+    batch: pyarrow.RecordBatch
+    for batch in reader:
+        if end_date_index is not None:
+            # End dates repeat across many rows, so only the distinct
+            # values in each batch are parsed
+            raw_end_dates: pyarrow.DictionaryArray = batch.column(
+                end_date_index
+            ).dictionary_encode()
+            # Empty (or otherwise unparseable) end dates become null
+            unique_end_dates: pyarrow.Array = pyarrow.compute.cast(
+                pyarrow.compute.strptime(
+                    raw_end_dates.dictionary,
+                    format="%m/%d/%Y",
+                    unit="s",
+                    error_is_null=True,
+                ),
+                pyarrow.date32(),
+            )
+            end_dates.update(unique_end_dates.drop_null().to_pylist())
+            # Keep rows with an end date after the indicated `after` date,
+            # or with no end date
+            if after_scalar is not None:
+                keep_unique_end_dates: pyarrow.BooleanArray = (
+                    pyarrow.compute.fill_null(
+                        pyarrow.compute.greater(
+                            unique_end_dates, after_scalar
+                        ),
+                        True,  # noqa: FBT003
+                    )
+                )
+                # Only filter (and copy) batches with some, but not all,
+                # rows to keep
+                if not pyarrow.compute.any(keep_unique_end_dates).as_py():
+                    continue
+                if not pyarrow.compute.all(keep_unique_end_dates).as_py():
+                    batch = batch.filter(  # noqa: PLW2901
+                        keep_unique_end_dates.take(raw_end_dates.indices)
+                    )
+        yield batch
 
 
 def get_after_end_date(directory: Path) -> date | None:
@@ -143,114 +274,430 @@ def get_after_end_date(directory: Path) -> date | None:
     or `None` if no files have an end date prefix.
     """
     end_date: date = DUMMY_END_DATE
-    path: Path
-    for path in directory.iterdir():
-        if path.suffix == ".csv" and path.is_file():
-            try:
-                end_date = max(
-                    datetime.strptime(  # noqa: DTZ007
-                        path.stem.partition(".")[0], "%Y-%m-%d"
-                    ).date(),
-                    end_date,
-                )
-            except ValueError:
-                # Ignore files that do not match the expected date format
-                continue
+    entry: os.DirEntry
+    # `os.scandir` provides file types from the directory listing, so no
+    # additional `stat` calls are needed
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".csv") and entry.is_file():
+                try:
+                    end_date = max(
+                        datetime.strptime(  # noqa: DTZ007
+                            entry.name.partition(".")[0], "%Y-%m-%d"
+                        ).date(),
+                        end_date,
+                    )
+                except ValueError:
+                    # Ignore files that do not match the expected date format
+                    continue
     if end_date == DUMMY_END_DATE:
         return None
     return end_date
 
 
-def download_hospital_dataset(
-    download_url: str, directory: Path, client: Client | None = None
+def load_sync_state(directory: Path) -> dict[str, dict[str, str]]:
+    """
+    Load the cache validators (`ETag` and `Last-Modified` response headers)
+    recorded for each download URL by the previous run, from the
+    `SYNC_STATE_FILE_NAME` file in `directory`. If the file is missing, or
+    cannot be parsed, an empty state is returned, so that every dataset is
+    downloaded.
+    """
+    path: Path = directory / SYNC_STATE_FILE_NAME
+    if not path.is_file():
+        return {}
+    sync_state_io: IO[str]
+    sync_state: object
+    with open(path) as sync_state_io:
+        try:
+            sync_state = json.load(sync_state_io)
+        except ValueError:
+            logger.warning("Ignoring unreadable sync state: %s", path)
+            return {}
+    if not isinstance(sync_state, dict):
+        logger.warning("Ignoring invalid sync state: %s", path)
+        return {}
+    return sync_state
+
+
+def save_sync_state(
+    directory: Path, sync_state: dict[str, dict[str, str]]
 ) -> None:
+    """
+    Atomically replace the `SYNC_STATE_FILE_NAME` file in `directory`.
+    """
+    path: Path = directory / SYNC_STATE_FILE_NAME
+    temp_path: Path = directory / f"{SYNC_STATE_FILE_NAME}.part"
+    sync_state_io: IO[str]
+    with open(temp_path, "w") as sync_state_io:
+        json.dump(sync_state, sync_state_io, indent=4, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def get_validators(headers: Message) -> dict[str, str]:
+    """
+    Get the cache validators (`ETag` and `Last-Modified`) from response
+    headers.
+    """
+    key: str
+    return {
+        key: headers[key]
+        for key in (
+            "ETag",
+            "Last-Modified",
+        )
+        if headers.get(key)
+    }
+
+
+def head_download(
+    download_url: str,
+    client: Client | None = None,
+    validators: Mapping[str, str] | None = None,
+) -> Message | None:
+    """
+    Get the response headers for a download using a HEAD request, or `None`
+    if the download has not been modified since the `validators`
+    (as returned by `get_validators`) were obtained.
+
+    Parameters:
+        download_url: The URL of the download.
+        client: If not provided, a new client will be created
+            and cached
+        validators: The `ETag` and/or `Last-Modified` headers of a previous
+            response for this download.
+    """
+    client = client or get_client()
+    validators = validators or {}
+    response: HTTPResponse | None = client.request_if_modified(  # type: ignore
+        download_url,
+        "HEAD",
+        etag=validators.get("ETag"),
+        last_modified=validators.get("Last-Modified"),
+    )
+    if response is None:
+        return None
+    with response:
+        return response.headers
+
+
+def get_range_content_length(headers: Message) -> int | None:
+    """
+    Get the size, in bytes, of a download if the server supports byte range
+    requests for it, otherwise `None`.
+
+    Parameters:
+        headers: The response headers for a HEAD request for the download.
+    """
+    accept_ranges: str = headers.get("Accept-Ranges", "")
+    content_length: str | None = headers.get("Content-Length")
+    if accept_ranges.strip().lower() != "bytes" or not content_length:
+        return None
+    return int(content_length)
+
+
+def read_range(
+    download_url: str, start: int, end: int, client: Client | None = None
+) -> bytes | None:
+    """
+    Read a byte range (inclusive of `start` and `end`) from a download,
+    or return `None` if the server does not honor the range request.
+
+    Parameters:
+        download_url: The URL of the download.
+        start: The index of the first byte to read.
+        end: The index of the last byte to read.
+        client: If not provided, a new client will be created
+            and cached
+    """
+    client = client or get_client()
+    response: HTTPResponse
+    with client.request(
+        download_url,
+        method="GET",
+        headers={"Range": f"bytes={start}-{end}"},
+    ) as response:
+        if response.status != 206:  # noqa: PLR2004
+            return None
+        return response.read()
+
+
+class ReadAheadIO(RawIOBase):
+    """
+    A raw binary stream which reads chunks from another stream in a
+    background thread, holding up to `READ_AHEAD_CHUNKS` chunks which have
+    not yet been consumed. Closing this stream also closes the source stream.
+
+    Parameters:
+        source: The stream from which to read.
+    """
+
+    def __init__(self, source: IO[bytes]) -> None:
+        super().__init__()
+        self._source: IO[bytes] = source
+        self._queue: Queue[bytes | BaseException] = Queue(
+            maxsize=READ_AHEAD_CHUNKS
+        )
+        self._buffer: memoryview = memoryview(b"")
+        self._end: bool = False
+        self._error: BaseException | None = None
+        self._stop: Event = Event()
+        self._thread: Thread = Thread(target=self._read_ahead, daemon=True)
+        self._thread.start()
+
+    def _read_ahead(self) -> None:
+        chunk: bytes
+        try:
+            while not self._stop.is_set():
+                chunk = self._source.read(READ_AHEAD_CHUNK_SIZE)
+                self._queue.put(chunk)
+                if not chunk:
+                    break
+        except BaseException as error:  # noqa: BLE001
+            # Errors are raised in the consuming thread
+            self._queue.put(error)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore
+        if not self._buffer:
+            if self._error is not None:
+                raise self._error
+            if self._end:
+                return 0
+            item: bytes | BaseException = self._queue.get()
+            if isinstance(item, BaseException):
+                # The background thread has stopped, so subsequent reads
+                # raise the same error (rather than waiting indefinitely)
+                self._error = item
+                raise item
+            if not item:
+                self._end = True
+                return 0
+            self._buffer = memoryview(item)
+        size: int = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            # Make room in the queue, so that the background thread is not
+            # blocked, then wait for it to finish before closing the source
+            while self._thread.is_alive():
+                while not self._queue.empty():
+                    self._queue.get_nowait()
+                self._thread.join(0.1)
+            self._source.close()
+        super().close()
+
+
+def open_download(
+    download_url: str, headers: Message, client: Client | None = None
+) -> IO[bytes]:
+    """
+    Open a download for reading. Downloads larger than
+    `RANGE_DOWNLOAD_THRESHOLD` are fetched as `RANGE_DOWNLOAD_PARTS` byte
+    ranges in parallel (and buffered in memory), if the server supports range
+    requests, otherwise the response is streamed (and read ahead in a
+    background thread).
+
+    Parameters:
+        download_url: The URL of the download.
+        headers: The response headers for a HEAD request for the download.
+        client: If not provided, a new client will be created
+            and cached
+    """
+    client = client or get_client()
+    content_length: int | None = get_range_content_length(headers)
+    if content_length is not None and (
+        content_length > RANGE_DOWNLOAD_THRESHOLD
+    ):
+        part_size: int = -(-content_length // RANGE_DOWNLOAD_PARTS)
+        start: int
+        with ThreadPoolExecutor(max_workers=RANGE_DOWNLOAD_PARTS) as executor:
+            parts: tuple[bytes | None, ...] = tuple(
+                executor.map(
+                    lambda start: read_range(
+                        download_url,
+                        start,
+                        min(start + part_size, content_length) - 1,
+                        client,
+                    ),
+                    range(0, content_length, part_size),
+                )
+            )
+        if None not in parts:
+            return BytesIO(b"".join(parts))  # type: ignore
+    # Read ahead from the response in a background thread, so that the
+    # download and parsing of the dataset overlap
+    return BufferedReader(
+        ReadAheadIO(client.request(download_url, method="GET")),  # type: ignore
+        buffer_size=READ_AHEAD_CHUNK_SIZE,
+    )
+
+
+def download_hospital_dataset(
+    download_url: str,
+    directory: Path,
+    client: Client | None = None,
+    validators: Mapping[str, str] | None = None,
+) -> dict[str, str]:
     """
     Download a CSV dataset from the CMS Provider Data API
     having only new records as determined by the end date, if the dataset
-    has an end date, or a complete dataset if it does not.
+    has an end date, or a complete dataset if it does not. If the dataset has
+    not been modified since the `validators` were obtained, nothing is
+    downloaded.
 
     Parameters:
         download_url: The URL to download the dataset from.
-        directory: The directory to download the dataset to.
+        directory: The directory to download the dataset to, which
+            must exist.
         client: If not provided, a new client will be created
             and cached
+        validators: The cache validators returned by the previous call
+            to this function for this `download_url`.
+
+    Returns:
+        The cache validators (`ETag` and/or `Last-Modified` headers) for the
+        dataset, which can be passed to the next call to this function.
     """
     client = client or get_client()
-    os.makedirs(directory, exist_ok=True)
+    headers: Message | None = head_download(download_url, client, validators)
+    if headers is None:
+        print(f"Skipping {download_url} (not modified)")  # noqa: T201
+        return dict(validators or {})
     name: str = download_url.rpartition("/")[-1]
-    temp_path: Path = directory / f"{name}"
-    response: HTTPResponse
+    # Write to a temporary file, which is only moved into place once
+    # complete, so that an interrupted download cannot leave a partial CSV
+    temp_path: Path = directory / f".{name}.part"
+    response: IO[bytes]
     end_dates: set[date] = set()
     after: date | None = get_after_end_date(directory)
-    print(f"Downloading {download_url} to {temp_path!s}")  # noqa: T201
-    with (
-        client.request(download_url, method="GET") as response,
-        open(temp_path, "w") as csv_io,
-    ):
-        csv.writer(csv_io).writerows(iter_csv(response, end_dates, after))
-    if DUMMY_END_DATE not in end_dates:
-        # Only delete or rename the un-dated file if there is an end date in
-        # the dataset
-        if end_dates:
+    print(f"Downloading {download_url} to {directory / name!s}")  # noqa: T201
+    reader: pyarrow.RecordBatchReader
+    output_stream: pyarrow.NativeFile
+    writer: pyarrow.csv.CSVWriter
+    batch: pyarrow.RecordBatch
+    path: Path | None = None
+    try:
+        with open_download(download_url, headers, client) as response:
+            reader = open_csv(response)
+            with (
+                pyarrow.output_stream(
+                    str(temp_path),
+                    compression=None,
+                    buffer_size=CSV_WRITE_BUFFER_SIZE,
+                ) as output_stream,
+                pyarrow.csv.CSVWriter(
+                    output_stream,
+                    reader.schema,
+                    write_options=pyarrow.csv.WriteOptions(
+                        batch_size=CSV_WRITE_BATCH_SIZE
+                    ),
+                ) as writer,
+            ):
+                for batch in iter_csv(reader, end_dates, after):
+                    writer.write_batch(batch)
+        if DUMMY_END_DATE in end_dates:
+            # Datasets without an end date are replaced in full
+            path = directory / name
+        elif end_dates:
             latest_end_date: date = max(end_dates)
+            # If the latest end date is not after the `after` date, there are
+            # no new records, so the file is discarded
             if (after is None) or latest_end_date > after:
-                os.rename(
-                    temp_path,
-                    directory / (f"{latest_end_date.isoformat()}.{name}"),
-                )
-            elif (after is not None) and latest_end_date <= after:
-                # If the latest end date is not after the `after` date,
-                # delete the file
-                temp_path.unlink()
+                path = directory / f"{latest_end_date.isoformat()}.{name}"
+    finally:
+        if path is None:
+            temp_path.unlink(missing_ok=True)
         else:
-            temp_path.unlink()
-
-
-def starmap_wrap(function: Callable) -> Any:
-    """
-    Wrap a function having positional arguments
-    for use with `ThreadPoolExecutor.map`.
-    """
-
-    def wrapper(arguments: tuple) -> Any:
-        return function(*arguments)
-
-    return wraps(function)(wrapper)
+            os.replace(temp_path, path)
+    return get_validators(headers)
 
 
 def download_hospital_datasets(
-    directory: Path = DATA, client: Client | None = None
-) -> Iterable[Dataset]:
+    directory: Path = DATA,
+    client: Client | None = None,
+    *,
+    processes: bool = False,
+) -> None:
     """
-    Download all datasets with the theme "Hospitals".
+    Download all datasets with the theme "Hospitals" which have been
+    modified since the previous run.
 
     Parameters:
         directory: The root directory to download the datasets to.
             If it does not exist, it will be created.
         client: If not provided, a new client will be created
             and cached
+        processes: If `True`, datasets will be downloaded and parsed in
+            a pool of processes (up to one per CPU) rather than a pool of
+            (up to `MAX_DOWNLOAD_THREADS`) threads.
+            Because pyarrow parses and filters CSV data without holding the
+            GIL, threads are usually sufficient, so this is `False` by
+            default.
     """
     os.makedirs(directory, exist_ok=True)
+    sync_state: dict[str, dict[str, str]] = load_sync_state(directory)
     identifier: str
     download_url: str
-    with ThreadPoolExecutor() as executor:
-        deque(
-            executor.map(
-                # map(
-                starmap_wrap(download_hospital_dataset),
-                (
-                    (
-                        download_url,
-                        directory / identifier,
-                        client,
-                    )
-                    for identifier, download_url in (
-                        iter_hospital_dataset_identifier_download_url(client)
-                    )
-                ),
-            ),
-            maxlen=0,
-        )
+    identifiers_download_urls: tuple[tuple[str, str], ...] = tuple(
+        iter_hospital_dataset_identifier_download_url(client)
+    )
+    # Create the dataset directories up-front, rather than in each worker
+    dataset_directory: Path
+    for dataset_directory in {
+        directory / identifier
+        for identifier, download_url in identifiers_download_urls
+    }:
+        dataset_directory.mkdir(exist_ok=True)
+    # Don't start more workers than there are datasets
+    max_workers: int = max(
+        min(
+            len(identifiers_download_urls),
+            (os.cpu_count() or 1) if processes else MAX_DOWNLOAD_THREADS,
+        ),
+        1,
+    )
+    executor: Executor = (
+        ProcessPoolExecutor(max_workers=max_workers)
+        if processes
+        else ThreadPoolExecutor(max_workers=max_workers)
+    )
+    errors: list[Exception] = []
+    futures_download_urls: dict[Future[dict[str, str]], str]
+    future: Future[dict[str, str]]
+    with executor:
+        futures_download_urls = {
+            executor.submit(
+                download_hospital_dataset,
+                download_url,
+                directory / identifier,
+                # Clients are pickled for use in a process pool, or, if no
+                # client is provided, each process creates (and caches) its
+                # own
+                client,
+                sync_state.get(download_url),
+            ): download_url
+            for identifier, download_url in identifiers_download_urls
+        }
+        # Record each dataset as soon as it finishes, so that one failed
+        # or slow download does not hold up the others
+        for future in as_completed(futures_download_urls):
+            download_url = futures_download_urls[future]
+            try:
+                sync_state[download_url] = future.result()
+            except Exception as error:
+                logger.exception("Failed to download %s", download_url)
+                errors.append(error)
+    # Validators for successful downloads are saved even if others failed
+    save_sync_state(directory, sync_state)
+    if errors:
+        raise errors[0]
 
 
 def main() -> None:
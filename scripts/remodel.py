@@ -2,22 +2,42 @@ from __future__ import annotations
 
 import json
 import os
-from collections.abc import Sequence
+import shutil
+from collections.abc import Iterable, Iterator, Sequence
 from copy import deepcopy
-from io import StringIO
 from pathlib import Path
+from string import Formatter
 from tempfile import gettempdir
 from typing import IO, TYPE_CHECKING, Any, cast
 from urllib.request import urlopen
 
 import gittable.download
 import oapi
+import sob
 import yaml  # type: ignore
 from sob.model import serialize
 
+from cms_gov_provider_data_sdk._base import AsyncClient as BaseAsyncClient
+from cms_gov_provider_data_sdk._base import Client as BaseClient
+
+try:
+    import orjson
+except ImportError:
+    # `orjson` is optional, and only used (when installed) to speed up
+    # parsing of the Open API document
+    orjson = None  # type: ignore
+
+# Use libyaml's C parser, when available
+YAML_LOADER: type[yaml.SafeLoader] = getattr(
+    yaml, "CSafeLoader", yaml.SafeLoader
+)
+
 OPENAPI_DOCUMENT_URL: str = "https://data.cms.gov/provider-data/api/1"
 OPENAPI_GIT_REPOSITORY_URL: str = ""
 OPENAPI_GIT_REPOSITORY_DOCUMENT_PATH: str = ""
+# This prefix is removed from all paths in the Open API document, since it
+# is already included in the server URL
+API_PATH_PREFIX: str = "/provider-data/api/1"
 
 PROJECT_PATH: Path = Path(__file__).absolute().parent.parent
 OPENAPI_PATH: Path = PROJECT_PATH / "openapi"
@@ -25,6 +45,54 @@ OPENAPI_ORIGINAL: Path = OPENAPI_PATH / "original.json"
 OPENAPI_FIXED: Path = OPENAPI_PATH / "fixed.json"
 MODEL_PY: Path = PROJECT_PATH / "src/cms_gov_provider_data_sdk" / "model.py"
 CLIENT_PY: Path = PROJECT_PATH / "src/cms_gov_provider_data_sdk" / "client.py"
+ASYNC_CLIENT_PY: Path = (
+    PROJECT_PATH / "src/cms_gov_provider_data_sdk" / "async_client.py"
+)
+# Parameters to include in the client `__init__` methods
+CLIENT_INIT_PARAMETERS: tuple[str, ...] = (
+    # Remove unused parameters from this tuple
+    "url",
+    "user",
+    "password",
+    "bearer_token",
+    "api_key",
+    "api_key_in",
+    "api_key_name",
+    "oauth2_client_id",
+    "oauth2_client_secret",
+    "oauth2_token_url",
+    "oauth2_username",
+    "oauth2_password",
+    "oauth2_authorization_url",
+    "oauth2_token_url",
+    "oauth2_scope",
+    "oauth2_refresh_url",
+    "oauth2_flows",
+    "open_id_connect_url",
+    "headers",
+    "timeout",
+    "retry_number_of_attempts",
+    "retry_for_errors",
+    "retry_hook",
+    "verify_ssl_certificate",
+    "logger",
+    "echo",
+)
+# Parameters of `cms_gov_provider_data_sdk._base.Client`, added to the
+# client `__init__` methods (and forwarded to the base class)
+CLIENT_ADD_INIT_PARAMETERS: tuple[str, ...] = (
+    "response_cache_ttl: float = 0.0",
+)
+CLIENT_ADD_INIT_PARAMETER_DOCS: tuple[str, ...] = (
+    (
+        "response_cache_ttl: If greater than zero, the bodies of `GET` "
+        "responses are cached by the client for up to this many seconds (or "
+        "for less, if a response's `Cache-Control` header so indicates), "
+        "and stale responses with `ETag` or `Last-Modified` headers are "
+        "revalidated with a conditional request. By default, responses are "
+        "not cached."
+    ),
+)
 STRING_SCHEMA: oapi.oas.Schema = oapi.oas.Schema(type_="string")
 BOOLEAN_SCHEMA: oapi.oas.Schema = oapi.oas.Schema(type_="boolean")
 
@@ -60,11 +128,16 @@ def get_openapi(
     with open(openapi_document_path) as openapi_document_io:
         openapi_document_json = openapi_document_io.read()
     openapi_document_json = fix_openapi_data(openapi_document_json)
-    openapi_document_io = StringIO(openapi_document_json)
+    # Parse the (fixed) document text directly, rather than copying it into
+    # a buffer to read from
     if schema_path_lowercase.endswith((".yaml", ".yml")):
-        openapi_document_dict = yaml.safe_load(openapi_document_io)
+        openapi_document_dict = yaml.load(
+            openapi_document_json, Loader=YAML_LOADER
+        )
+    elif orjson is None:
+        openapi_document_dict = json.loads(openapi_document_json)
     else:
-        openapi_document_dict = json.load(openapi_document_io)
+        openapi_document_dict = orjson.loads(openapi_document_json)
     return oapi.oas.OpenAPI(openapi_document_dict)
 
 
@@ -100,15 +173,16 @@ def fix_openapi(
         description="An array of datasets.",
     )
     # Remove unnecessary path prefixes
-    openapi_document_paths: oapi.oas.Paths = cast(
-        oapi.oas.Paths, openapi_document.paths
-    )
     path: str
     path_item: oapi.oas.PathItem
-    for path in tuple(openapi_document_paths.keys()):
-        if not path.startswith("/provider-data/api/1/"):
+    openapi_document_paths: oapi.oas.Paths = oapi.oas.Paths()
+    for path, path_item in cast(
+        oapi.oas.Paths, openapi_document.paths
+    ).items():
+        if not path.startswith(f"{API_PATH_PREFIX}/"):
             raise ValueError(path)
-        openapi_document_paths[path[20:]] = openapi_document_paths.pop(path)
+        openapi_document_paths[path[len(API_PATH_PREFIX) :]] = path_item
+    openapi_document.paths = openapi_document_paths
     # Add the metastore schemas dataset endpoint for retrieving *all* datasets
     # by copying the path for retrieving a single dataset
     metastore_schemas_dataset_items: oapi.oas.PathItem
@@ -155,10 +229,9 @@ def download(
     with use of `gittable.download.download`.
     """
     response: IO[bytes]
-    with urlopen(url) as response:  # noqa: S310
-        data: bytes = response.read()
-    with open(path, "wb") as file:
-        file.write(data)
+    file: IO[bytes]
+    with urlopen(url) as response, open(path, "wb") as file:  # noqa: S310
+        shutil.copyfileobj(response, file, 1 << 20)
 
 
 def update_openapi_original() -> Path | None:
@@ -181,10 +254,13 @@ def update_openapi_original() -> Path | None:
     return None
 
 
-def update_model() -> Path | None:
+def update_openapi_fixed() -> oapi.oas.OpenAPI:
     """
-    Refresh (or initialize) the client's data model from the source Open API
-    document.
+    Refresh the original Open API document, apply fixes to it, and save the
+    fixed document.
+
+    Returns:
+        The fixed Open API document.
     """
     update_openapi_original()
     if not OPENAPI_ORIGINAL.exists():
@@ -197,6 +273,20 @@ def update_model() -> Path | None:
         "w",
     ) as fixed_io:
         fixed_io.write(serialize(open_api, indent=4))
+    return open_api
+
+
+def update_model(open_api: oapi.oas.OpenAPI | None = None) -> Path | None:
+    """
+    Refresh (or initialize) the client's data model from the source Open API
+    document.
+
+    Parameters:
+        open_api: The fixed Open API document, as returned by
+            `update_openapi_fixed`. If not provided, it will be refreshed.
+    """
+    if open_api is None:
+        open_api = update_openapi_fixed()
     oapi.write_model_module(
         MODEL_PY,
         open_api=open_api,
@@ -204,15 +294,258 @@ def update_model() -> Path | None:
     return MODEL_PY
 
 
-def update_client() -> None:
-    open_api: oapi.oas.OpenAPI = get_openapi(OPENAPI_FIXED)
+class ClientModule(oapi.ClientModule):
+    """
+    Generates a client module in which operation methods do as little
+    redundant work, per request, as possible:
+
+    - Argument formatters (`oapi.client.format_argument_value` with a given
+      style and explode option) are bound once, at import time, and query
+      parameters are only formatted when an argument has been passed.
+    - Paths are assembled as f-strings, rather than by parsing a template
+      (with `str.format`) for every request, and string path arguments
+      are interpolated without being passed through a formatter.
+    - Response property types (such as `sob.StringProperty()`) are
+      instantiated once, at import time, rather than for every request.
+    - Text-only responses (such as CSV downloads) are decoded directly,
+      rather than being parsed as JSON and then unmarshalled.
+    - JSON responses are deserialized by the client's `_deserialize`
+      method (which uses `orjson`, when installed).
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Module-level names and the source code for their values
+        self._module_constants: dict[str, str] = {}
+
+    def _get_argument_formatter(self, style: str, *, explode: bool) -> str:
+        """
+        Get the name of a module-level argument formatter for a given
+        parameter style and explode option, defining it if needed.
+        """
+        name: str = "_format_{}{}".format(
+            sob.utilities.get_property_name(style),
+            "_explode" if explode else "",
+        )
+        if name not in self._module_constants:
+            self._imports.add("import functools")
+            self._module_constants[name] = (
+                "functools.partial(\n"
+                "    oapi.client.format_argument_value,\n"
+                f"    style={style!r},\n"
+                f"    explode={explode!r},\n"
+                ")"
+            ).replace("'", '"')
+        return name
+
+    def _get_response_property(self, property_: sob.abc.Property) -> str:
+        """
+        Get the name of a module-level instance of a response property,
+        defining it if needed.
+        """
+        representation: str = self._represent_type(property_)
+        name: str = "_" + (
+            sob.utilities.get_property_name(type(property_).__name__).upper()
+        )
+        index: int = 1
+        unique_name: str = name
+        while self._module_constants.get(unique_name, representation) != (
+            representation
+        ):
+            index += 1
+            unique_name = f"{name}_{index}"
+        self._module_constants[unique_name] = representation
+        return unique_name
+
+    def _iter_response_types_source(
+        self, operation: oapi.oas.Operation
+    ) -> Iterable[str]:
+        type_: type[sob.abc.Model] | sob.abc.Property
+        representation: str
+        for representation in dict.fromkeys(
+            self._get_response_property(type_)
+            if isinstance(type_, sob.abc.Property)
+            else self._represent_type(type_)
+            for type_ in self._iter_operation_response_types(operation)
+        ):
+            yield f"                {representation},"
+
+    def _iter_request_query_source(
+        self, query: dict[str, Any]
+    ) -> Iterable[str]:
+        yield "            query={"
+        yield "                name: format_argument_value(name, value)"
+        yield "                for name, format_argument_value, value in ("
+        argument_name: str
+        parameter: Any
+        for argument_name, parameter in query.items():
+            formatter: str = self._get_argument_formatter(
+                parameter.style, explode=parameter.explode
+            )
+            yield (
+                f'                    ("{parameter.name}", {formatter}, '
+                f"{argument_name}),"
+            )
+        yield "                )"
+        yield "                if value is not None"
+        yield "            },"
+
+    def _iter_request_path_source(
+        self, path: str, path_parameters: dict[str, Any]
+    ) -> Iterable[str] | None:
+        """
+        Yield lines (implicitly) concatenating the literal segments of a path
+        template with f-strings of path arguments, or return `None` if a field
+        in the template does not match a path parameter. String arguments are
+        interpolated directly, since formatting a string in the "simple"
+        style leaves it unchanged.
+        """
+        argument_names: dict[str, str] = {
+            parameter.name: argument_name
+            for argument_name, parameter in path_parameters.items()
+        }
+        terms: list[str] = []
+        literal: str
+        field_name: str | None
+        for literal, field_name, _, _ in Formatter().parse(path):
+            if literal:
+                terms.append(json.dumps(literal))
+            if field_name is not None:
+                if field_name not in argument_names:
+                    return None
+                argument_name: str = argument_names[field_name]
+                parameter: Any = path_parameters[argument_name]
+                if parameter.style == "simple" and (
+                    tuple(map(type, parameter.types)) == (sob.StringProperty,)
+                ):
+                    terms.append(f'f"{{{argument_name}}}"')
+                else:
+                    formatter: str = self._get_argument_formatter(
+                        parameter.style, explode=parameter.explode
+                    )
+                    terms.append(
+                        f"f\"{{{formatter}('{field_name}', "
+                        f'{argument_name})}}"'
+                    )
+        if len(terms) == 1:
+            return (f"            {terms[0]},",)
+        return (
+            "            (",
+            *(f"                {term}" for term in terms),
+            "            ),",
+        )
+
+    def _iter_operation_method_definition(
+        self,
+        path: str,
+        method: str,
+        operation: oapi.oas.Operation,
+        parameter_locations: Any,
+    ) -> Iterable[str]:
+        lines: list[str] = list(
+            super()._iter_operation_method_definition(
+                path, method, operation, parameter_locations
+            )
+        )
+        if parameter_locations.path:
+            # Replace the path template, formatted using `str.format`
+            path_source: Iterable[str] | None = self._iter_request_path_source(
+                path, parameter_locations.path
+            )
+            if path_source is not None:
+                lines[1 : lines.index("            }),") + 1] = path_source
+        if parameter_locations.query and "            query={" in lines:
+            # Replace the query dictionary, in which every parameter is
+            # formatted (even when no argument was passed)
+            start: int = lines.index("            query={")
+            end: int = lines.index("            },", start) + 1
+            lines[start:end] = self._iter_request_query_source(
+                parameter_locations.query
+            )
+        unmarshal: str = "        return sob.unmarshal(  # type: ignore"
+        if unmarshal in lines and all(
+            isinstance(type_, sob.abc.StringProperty)
+            for type_ in self._iter_operation_response_types(operation)
+        ):
+            # Text responses are decoded, rather than being parsed as JSON
+            start = lines.index(unmarshal)
+            lines[start : lines.index("        )", start) + 1] = (
+                "        data: str | bytes = response.read()",
+                "        return (",
+                "            data",
+                "            if isinstance(data, str)",
+                '            else str(data, encoding="utf-8")',
+                "        )",
+            )
+        elif "            types=(" in lines:
+            # Replace response property instantiations with references to
+            # module-level instances
+            start = lines.index("            types=(") + 1
+            lines[start : start + 1] = self._iter_response_types_source(
+                operation
+            )
+            # Deserialize JSON using the client's `_deserialize` method
+            lines[lines.index("            sob.deserialize(response),")] = (
+                "            self._deserialize(response),"
+            )
+        return lines
+
+    def _iter_class_declaration_source(self) -> Iterable[str]:
+        yield from super()._iter_class_declaration_source()
+        # Client instances only have the attributes declared (as slots) by
+        # the base classes
+        yield "    __slots__: tuple[str, ...] = ()"
+        yield ""
+
+    def _iter_init_method_source(self) -> Iterable[str]:
+        # `oapi` declares added parameters, but doesn't pass them to the
+        # base class
+        line: str
+        for line in super()._iter_init_method_source():
+            if line == "        )":
+                declaration: str
+                for declaration in self._add_init_parameters:
+                    name: str = declaration.partition(":")[0].strip()
+                    yield f"            {name}={name},"
+            yield line
+
+    def get_source(self, path: str | Path) -> str:
+        source: str = super().get_source(path)
+        if not self._module_constants:
+            return source
+        # Module-level constants are declared after the imports, and before
+        # the client class
+        imports: str
+        class_source: str
+        imports, class_source = source.split("\n\n\nclass ", 1)
+        name: str
+        value: str
+        constants: str = "\n".join(
+            f"{name} = {value}"
+            for name, value in sorted(self._module_constants.items())
+        )
+        return f"{imports}\n\n{constants}\n\n\nclass {class_source}"
+
+
+def update_client(open_api: oapi.oas.OpenAPI | None = None) -> None:
+    """
+    Refresh (or initialize) the client module.
+
+    Parameters:
+        open_api: The fixed Open API document, as returned by
+            `update_openapi_fixed`. If not provided, it will be read from
+            `OPENAPI_FIXED`.
+    """
+    if open_api is None:
+        open_api = get_openapi(OPENAPI_FIXED)
     url: str = ""
     if open_api.servers:
         url = cast(str, cast(Sequence, open_api.servers)[0].url)
-    oapi.write_client_module(
-        CLIENT_PY,
+    ClientModule(
         open_api=open_api,
         model_path=MODEL_PY,
+        # The base client class re-uses persistent HTTP(S) connections
+        base_class=BaseClient,
         # Important: See the documentation for detailed information about all
         # parameters:
         # https://oapi.enorganic.org/api/oapi.client/#oapi.client.write_client_module
@@ -224,45 +557,76 @@ def update_client() -> None:
         # initialization parameters, so limiting initialization parameters
         # using `include_init_parameters` is important to avoid confusing
         # users (particularly with regards to authentication options).
-        include_init_parameters=(
-            # Remove unused parameters from this tuple
-            "url",
-            "user",
-            "password",
-            "bearer_token",
-            "api_key",
-            "api_key_in",
-            "api_key_name",
-            "oauth2_client_id",
-            "oauth2_client_secret",
-            "oauth2_token_url",
-            "oauth2_username",
-            "oauth2_password",
-            "oauth2_authorization_url",
-            "oauth2_token_url",
-            "oauth2_scope",
-            "oauth2_refresh_url",
-            "oauth2_flows",
-            "open_id_connect_url",
-            "headers",
-            "timeout",
-            "retry_number_of_attempts",
-            "retry_for_errors",
-            "retry_hook",
-            "verify_ssl_certificate",
-            "logger",
-            "echo",
-        ),
+        include_init_parameters=CLIENT_INIT_PARAMETERS,
+        add_init_parameters=CLIENT_ADD_INIT_PARAMETERS,
+        add_init_parameter_docs=CLIENT_ADD_INIT_PARAMETER_DOCS,
         init_parameter_defaults={
             "url": url,
             "retry_number_of_attempts": 3,
         },
-    )
+    ).save(CLIENT_PY)
+
+
+class AsyncClientModule(ClientModule):
+    """
+    Generates a client module with asynchronous (`async def`) operation
+    methods, which await the `request` method of
+    `cms_gov_provider_data_sdk._base.AsyncClient`.
+    """
+
+    def _iter_operation_method_declaration(
+        self, *args: Any, **kwargs: Any
+    ) -> Iterable[str]:
+        lines: Iterator[str] = iter(
+            super()._iter_operation_method_declaration(*args, **kwargs)
+        )
+        yield next(lines).replace("    def ", "    async def ", 1)
+        yield from lines
+
+    def _iter_operation_method_definition(
+        self, *args: Any, **kwargs: Any
+    ) -> Iterable[str]:
+        line: str
+        for line in super()._iter_operation_method_definition(*args, **kwargs):
+            yield line.replace("self.request(", "await self.request(", 1)
+
+
+def update_async_client(open_api: oapi.oas.OpenAPI | None = None) -> None:
+    """
+    Refresh (or initialize) the asynchronous client module.
+
+    Parameters:
+        open_api: The fixed Open API document, as returned by
+            `update_openapi_fixed`. If not provided, it will be read from
+            `OPENAPI_FIXED`.
+    """
+    if open_api is None:
+        open_api = get_openapi(OPENAPI_FIXED)
+    url: str = ""
+    if open_api.servers:
+        url = cast(str, cast(Sequence, open_api.servers)[0].url)
+    AsyncClientModule(
+        open_api=open_api,
+        model_path=MODEL_PY,
+        class_name="AsyncClient",
+        base_class=BaseAsyncClient,
+        include_init_parameters=CLIENT_INIT_PARAMETERS,
+        add_init_parameters=CLIENT_ADD_INIT_PARAMETERS,
+        add_init_parameter_docs=CLIENT_ADD_INIT_PARAMETER_DOCS,
+        init_parameter_defaults={
+            "url": url,
+            "retry_number_of_attempts": 3,
+        },
+    ).save(ASYNC_CLIENT_PY)
 
 
 def main() -> None:
-    update_model()
-    update_client()
+    # The fixed Open API document is parsed once, and shared by the model
+    # and clients
+    open_api: oapi.oas.OpenAPI = update_openapi_fixed()
+    update_model(open_api)
+    update_client(open_api)
+    update_async_client(open_api)
 
 
 if __name__ == "__main__":
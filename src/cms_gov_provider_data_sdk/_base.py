@@ -0,0 +1,1841 @@
+from __future__ import annotations
+
+import asyncio
+import codecs
+import collections.abc
+import re
+import time
+import typing
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from copy import copy
+from functools import partial
+from http import HTTPStatus
+from http.client import HTTPConnection, HTTPResponse
+from io import BytesIO, RawIOBase
+from itertools import chain
+from json import JSONDecoder, dumps
+from threading import Lock
+from urllib.error import HTTPError, URLError
+from urllib.request import (
+    BaseHandler,
+    HTTPCookieProcessor,
+    HTTPHandler,
+    HTTPSHandler,
+    OpenerDirector,
+    Request,
+    build_opener,
+)
+
+import oapi
+import sob
+from oapi.client import SSLContext, retry
+
+from . import model
+
+try:
+    import orjson
+except ImportError:
+    # `orjson` is optional, and only used (when installed) to speed up
+    # JSON serialization and deserialization
+    orjson = None  # type: ignore
+
+if typing.TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Iterator
+    from email.message import Message
+
+# The maximum number of idle connections retained, per host
+CONNECTION_POOL_MAXSIZE: int = 32
+# The default number of requests sent concurrently by bulk (`map_*`) methods
+MAP_MAX_WORKERS: int = 10
+# Responses are requested with this content encoding, for methods which
+# return a body, unless a byte range or content encoding is specified
+ACCEPT_ENCODING: str = "gzip"
+# The number of compressed bytes read from a response at a time
+GZIP_READ_SIZE: int = 1 << 16
+# OAuth2 access tokens are refreshed this many seconds before they expire
+# (or half-way through their lifetime, if sooner)
+OAUTH2_AUTHORIZATION_REFRESH_MARGIN: int = 300
+# The maximum number of responses retained by a client's response cache
+RESPONSE_CACHE_MAXSIZE: int = 256
+# Responses with a (declared) length greater than this number of bytes are
+# not cached
+RESPONSE_CACHE_MAX_CONTENT_LENGTH: int = 1 << 23
+# The number of bytes read at a time when parsing a JSON response
+# incrementally
+JSON_STREAM_READ_SIZE: int = 1 << 16
+
+_ConnectionKey = tuple[type[HTTPConnection], str, typing.Optional[float]]
+
+# Requests using these methods may be sent again if the connection is lost
+# before a response is received (see RFC 9110, section 9.2.2)
+_IDEMPOTENT_METHODS: frozenset[str] = frozenset(
+    ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+)
+
+
+class _ConnectionPool:
+    """
+    A thread-safe pool of idle, persistent (keep-alive), HTTP(S)
+    connections, keyed by connection class, host and timeout.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_lock",
+        "_connections",
+        "_closed",
+        "maxsize",
+    )
+
+    def __init__(self, maxsize: int = CONNECTION_POOL_MAXSIZE) -> None:
+        self._lock: Lock = Lock()
+        self._connections: dict[_ConnectionKey, list[HTTPConnection]] = {}
+        self._closed: bool = False
+        self.maxsize: int = maxsize
+
+    def get(self, key: _ConnectionKey) -> HTTPConnection | None:
+        """
+        Get an idle connection, or `None` if there are no idle connections
+        for this `key`.
+        """
+        with self._lock:
+            connections: list[HTTPConnection] | None = self._connections.get(
+                key
+            )
+            if connections:
+                return connections.pop()
+        return None
+
+    def put(self, key: _ConnectionKey, connection: HTTPConnection) -> None:
+        """
+        Return an idle connection to the pool, or close it if the pool
+        is full.
+        """
+        with self._lock:
+            if not self._closed:
+                connections: list[HTTPConnection] = (
+                    self._connections.setdefault(key, [])
+                )
+                if len(connections) < self.maxsize:
+                    connections.append(connection)
+                    return
+        connection.close()
+
+    def close(self) -> None:
+        """
+        Close all idle connections. Connections released to the pool
+        after it has been closed are closed, rather than retained.
+        """
+        with self._lock:
+            self._closed = True
+            connections: list[list[HTTPConnection]] = list(
+                self._connections.values()
+            )
+            self._connections.clear()
+        connection: HTTPConnection
+        for connection in chain.from_iterable(connections):
+            connection.close()
+
+
+class _PooledHTTPResponse(HTTPResponse):
+    """
+    An HTTP response which releases its connection back to a connection
+    pool once the response body has been read in full.
+    """
+
+    _release: typing.Callable[[bool], None] | None = None
+
+    def _close_conn(self) -> None:
+        # This is called when the end of the response body is reached
+        super()._close_conn()  # type: ignore
+        release: typing.Callable[[bool], None] | None = self._release
+        self._release = None
+        if release is not None:
+            release(not self.will_close)
+
+    def close(self) -> None:
+        # If the response is closed before the body has been read in full,
+        # the connection cannot be re-used (unless there is no body, as is
+        # the case for HEAD requests)
+        reusable: bool = self.length == 0 and not self.will_close
+        release: typing.Callable[[bool], None] | None = self._release
+        self._release = None
+        super().close()
+        if release is not None:
+            release(reusable)
+
+
+def _release_connection(
+    connection_pool: _ConnectionPool,
+    key: _ConnectionKey,
+    connection: HTTPConnection,
+    reusable: bool,  # noqa: FBT001
+) -> None:
+    if reusable:
+        connection_pool.put(key, connection)
+    else:
+        connection.close()
+
+
+def _get_request_headers(request: Request) -> dict[str, str]:
+    # Unlike `urllib.request.AbstractHTTPHandler.do_open`, no
+    # "Connection: close" header is added, so that connections are kept alive
+    headers: dict[str, str] = dict(request.unredirected_hdrs)
+    key: str
+    value: str
+    headers.update(
+        (key, value)
+        for key, value in request.headers.items()
+        if key not in headers
+    )
+    return {key.title(): value for key, value in headers.items()}
+
+
+def _send_request(
+    connection: HTTPConnection, request: Request, headers: dict[str, str]
+) -> HTTPResponse:
+    try:
+        connection.request(
+            request.get_method(),
+            request.selector,
+            request.data,  # type: ignore
+            headers,
+            encode_chunked=request.has_header("Transfer-encoding"),
+        )
+    except OSError as error:
+        raise URLError(error) from error
+    return connection.getresponse()
+
+
+def _is_connection_error(error: Exception) -> bool:
+    return isinstance(
+        error.reason if isinstance(error, URLError) else error,
+        ConnectionError,
+    )
+
+
+def _open_pooled_connection(
+    connection_pool: _ConnectionPool,
+    http_class: type[HTTPConnection],
+    request: Request,
+    **kwargs: typing.Any,
+) -> HTTPResponse:
+    """
+    Send a request using an idle connection from `connection_pool`, if one is
+    available, otherwise using a new connection, and return the response.
+    """
+    host: str = request.host
+    if not host:
+        message: str = "no host given"
+        raise URLError(message)
+    key: _ConnectionKey = (
+        http_class,
+        host,
+        request.timeout,  # type: ignore
+    )
+    headers: dict[str, str] = _get_request_headers(request)
+    response: HTTPResponse | None = None
+    connection: HTTPConnection | None = connection_pool.get(key)
+    if connection is not None:
+        try:
+            response = _send_request(connection, request, headers)
+        except (URLError, ConnectionError) as error:
+            connection.close()
+            # An idle connection may have been closed by the server, in
+            # which case an idempotent request is sent again on a new
+            # connection. Other requests are not, since the server may
+            # have processed the request before closing the connection.
+            if not (
+                _is_connection_error(error)
+                and request.get_method() in _IDEMPOTENT_METHODS
+            ):
+                raise
+        except BaseException:
+            connection.close()
+            raise
+    if response is None:
+        connection = http_class(
+            host,
+            timeout=request.timeout,  # type: ignore
+            **kwargs,
+        )
+        connection.response_class = _PooledHTTPResponse
+        try:
+            response = _send_request(connection, request, headers)
+        except BaseException:
+            connection.close()
+            raise
+    if typing.TYPE_CHECKING:
+        assert connection is not None
+    typing.cast(_PooledHTTPResponse, response)._release = partial(  # noqa: SLF001
+        _release_connection, connection_pool, key, connection
+    )
+    response.url = request.get_full_url()  # type: ignore
+    response.msg = response.reason  # type: ignore
+    return response
+
+
+class _KeepAliveHTTPHandler(HTTPHandler):
+    def __init__(self, connection_pool: _ConnectionPool) -> None:
+        super().__init__()
+        self._connection_pool: _ConnectionPool = connection_pool
+
+    def do_open(  # type: ignore
+        self,
+        http_class: type[HTTPConnection],
+        req: Request,
+        **http_conn_args: typing.Any,
+    ) -> HTTPResponse:
+        if req._tunnel_host:  # type: ignore # noqa: SLF001
+            # Connections through a proxy tunnel are not pooled
+            return super().do_open(http_class, req, **http_conn_args)
+        return _open_pooled_connection(
+            self._connection_pool, http_class, req, **http_conn_args
+        )
+
+
+class _KeepAliveHTTPSHandler(HTTPSHandler):
+    def __init__(
+        self, connection_pool: _ConnectionPool, context: SSLContext
+    ) -> None:
+        super().__init__(context=context)
+        self._connection_pool: _ConnectionPool = connection_pool
+
+    def do_open(  # type: ignore
+        self,
+        http_class: type[HTTPConnection],
+        req: Request,
+        **http_conn_args: typing.Any,
+    ) -> HTTPResponse:
+        if req._tunnel_host:  # type: ignore # noqa: SLF001
+            # Connections through a proxy tunnel are not pooled
+            return super().do_open(http_class, req, **http_conn_args)
+        return _open_pooled_connection(
+            self._connection_pool, http_class, req, **http_conn_args
+        )
+
+
+_ClientT = typing.TypeVar("_ClientT", bound="Client")
+_T = typing.TypeVar("_T")
+_DatastoreQueryT = typing.TypeVar(
+    "_DatastoreQueryT", model.DatastoreQuery, model.DatastoreResourceQuery
+)
+
+
+def _retry_unless_not_modified(
+    retry_hook: typing.Callable[[Exception], bool], error: Exception
+) -> bool:
+    """
+    Defer to `retry_hook`, except that an HTTP 304 (NOT MODIFIED) response
+    is never retried.
+    """
+    if isinstance(error, HTTPError) and error.code == HTTPStatus.NOT_MODIFIED:
+        return False
+    return retry_hook(error)
+
+
+def _is_gzip_encoded(headers: Message) -> bool:
+    return headers.get("Content-Encoding", "").strip().lower() == "gzip"
+
+
+def _represent_decoded_response(response: HTTPResponse, data: bytes) -> str:
+    """
+    Represent a response, with its decoded body, in the same format as
+    `oapi.client._represent_http_response` (which would attempt to decode
+    the body again, based on the response's `Content-Encoding` header).
+    """
+    headers: str = "\n".join(
+        f"{key}: {value}" for key, value in response.headers.items()
+    )
+    body: str = (
+        f"\n\n{str(data, encoding='utf-8', errors='ignore')}" if data else ""
+    )
+    return f"{response.geturl()}\n{response.getcode()}\n{headers}{body}"
+
+
+class _GzipErrorProcessor(BaseHandler):
+    """
+    Decode the body of gzip-encoded error responses before they are raised
+    (as an `HTTPError`), so that the error's body and headers are those of
+    an un-encoded response.
+    """
+
+    # Response processors are applied in this order, so this precedes
+    # `urllib.request.HTTPErrorProcessor` (which has an order of 1000)
+    handler_order = 999
+
+    def http_response(
+        self, request: Request, response: HTTPResponse
+    ) -> HTTPResponse:
+        if (
+            response.status >= HTTPStatus.BAD_REQUEST
+            and request.get_method() != "HEAD"
+            and _is_gzip_encoded(response.headers)
+        ):
+            data: bytes = HTTPResponse.read(response)
+            try:
+                data = zlib.decompress(data, 16 + zlib.MAX_WBITS)
+            except zlib.error:
+                # Leave the body, and its `Content-Encoding`, as received
+                pass
+            else:
+                del (
+                    response.headers["Content-Encoding"],
+                    response.headers["Content-Length"],
+                    response.headers["Transfer-Encoding"],
+                )
+                response.headers["Content-Length"] = str(len(data))
+            # The body has been read in full (releasing the connection), so
+            # it is replaced with a buffer from which it can be read again
+            response.fp = BytesIO(data)  # type: ignore
+            response.length = len(data)
+            response.chunked = False
+        return response
+
+    https_response = http_response
+
+
+class _GzipDecodedResponse(RawIOBase):
+    """
+    A file-like wrapper for a gzip-encoded HTTP response, which decodes
+    the response body incrementally as it is read. All other attributes
+    (`headers`, `status`, `url`, etc.) are those of the wrapped response.
+    If a `callback` is provided, it is passed a representation of the
+    response (with decoded content) each time the response is read.
+    """
+
+    def __init__(
+        self,
+        response: HTTPResponse,
+        callback: typing.Callable[[str], None] | None = None,
+    ) -> None:
+        super().__init__()
+        self._response: HTTPResponse = response
+        self._callback: typing.Callable[[str], None] | None = callback
+        self._decompressor: typing.Any = zlib.decompressobj(
+            16 + zlib.MAX_WBITS
+        )
+        self._decoded: bytes = b""
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self._response, name)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: typing.Any) -> int:
+        size: int = len(buffer)
+        while not self._decoded:
+            if self._decompressor.unconsumed_tail:
+                self._decoded = self._decompressor.decompress(
+                    self._decompressor.unconsumed_tail, size
+                )
+                continue
+            if self._decompressor.eof:
+                # Read any remainder of the response body, so that the
+                # connection can be re-used
+                HTTPResponse.read(self._response)
+                return 0
+            # The undecorated `read` method is used, since `oapi` would
+            # attempt to decompress (and represent) each chunk read
+            data: bytes = HTTPResponse.read(self._response, GZIP_READ_SIZE)
+            if not data:
+                self._decoded = self._decompressor.flush()
+                if not self._decoded:
+                    return 0
+                break
+            self._decoded = self._decompressor.decompress(data, size)
+        decoded: bytes = self._decoded[:size]
+        self._decoded = self._decoded[size:]
+        buffer[: len(decoded)] = decoded
+        if self._callback is not None:
+            self._callback(
+                _represent_decoded_response(self._response, decoded)
+            )
+        return len(decoded)
+
+    def readall(self) -> bytes:
+        # Any content already decompressed (but not yet read), or which
+        # was held back by a size-limited `readinto`, precedes the
+        # remainder of the response body
+        decoded: bytes = self._decoded
+        self._decoded = b""
+        if self._decompressor.unconsumed_tail:
+            decoded += self._decompressor.decompress(
+                self._decompressor.unconsumed_tail
+            )
+        decoded += (
+            self._decompressor.decompress(HTTPResponse.read(self._response))
+            + self._decompressor.flush()
+        )
+        if self._callback is not None:
+            self._callback(
+                _represent_decoded_response(self._response, decoded)
+            )
+        return decoded
+
+    def close(self) -> None:
+        self._response.close()
+        super().close()
+
+
+class _CachedResponse:
+    """
+    The body, status, headers and URL of a cached HTTP response.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "data",
+        "status",
+        "reason",
+        "headers",
+        "url",
+        "expires",
+    )
+
+    def __init__(
+        self,
+        data: bytes,
+        status: int,
+        reason: str,
+        headers: Message,
+        url: str,
+        expires: float,
+    ) -> None:
+        self.data: bytes = data
+        self.status: int = status
+        self.reason: str = reason
+        self.headers: Message = headers
+        self.url: str = url
+        # The time (per `time.monotonic`) at which the response becomes
+        # stale
+        self.expires: float = expires
+
+    def open(self) -> sob.abc.Readable:
+        return _CachedResponseBody(self)  # type: ignore
+
+
+class _CachedResponseBody(BytesIO):
+    """
+    A file-like copy of a cached response body, with the `status`,
+    `reason`, `headers` and `url` of the cached response.
+    """
+
+    def __init__(self, response: _CachedResponse) -> None:
+        super().__init__(response.data)
+        self.status: int = response.status
+        self.reason: str = response.reason
+        self.headers: Message = response.headers
+        self.url: str = response.url
+
+    def getheader(self, name: str, default: str | None = None) -> str | None:
+        return self.headers.get(name, default)
+
+
+_ResponseCacheKey = tuple[str, str, tuple[tuple[str, str], ...]]
+
+
+class _ResponseCache:
+    """
+    A thread-safe, least-recently-used, cache of HTTP responses.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_lock",
+        "_responses",
+        "maxsize",
+    )
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_MAXSIZE) -> None:
+        self._lock: Lock = Lock()
+        self._responses: OrderedDict[_ResponseCacheKey, _CachedResponse] = (
+            OrderedDict()
+        )
+        self.maxsize: int = maxsize
+
+    def get(self, key: _ResponseCacheKey) -> _CachedResponse | None:
+        """
+        Get a cached response (whether stale or not), or `None`.
+        """
+        with self._lock:
+            response: _CachedResponse | None = self._responses.get(key)
+            if response is not None:
+                self._responses.move_to_end(key)
+            return response
+
+    def put(self, key: _ResponseCacheKey, response: _CachedResponse) -> None:
+        """
+        Cache a response, evicting the least recently used response if the
+        cache is full.
+        """
+        with self._lock:
+            self._responses[key] = response
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.maxsize:
+                self._responses.popitem(last=False)
+
+
+def _iter_items(items: typing.Any) -> Iterable[tuple[str, typing.Any]]:
+    return (
+        items.items() if isinstance(items, collections.abc.Mapping) else items
+    )
+
+
+def _has_header(
+    headers: typing.Any,
+    names: tuple[str, ...],
+) -> bool:
+    key: str
+    return any(key.lower() in names for key, _ in _iter_items(headers))
+
+
+def _get_response_cache_key(
+    path: str, query: typing.Any, headers: typing.Any
+) -> _ResponseCacheKey:
+    if not isinstance(query, str):
+        item: tuple[str, typing.Any]
+        query = oapi.client.urlencode(
+            tuple(item for item in _iter_items(query) if item[1] is not None)
+        )
+    key: str
+    value: typing.Any
+    return (
+        path,
+        query,
+        tuple(
+            (key.lower(), str(value))
+            for key, value in _iter_items(headers)
+            if key and value
+        ),
+    )
+
+
+def _get_response_cache_lifetime(
+    headers: Message, response_cache_ttl: float
+) -> float | None:
+    """
+    Get the number of seconds for which a response may be cached, given the
+    response headers and the client's `response_cache_ttl`, or `None` if
+    the response may not be stored.
+    """
+    lifetime: float = response_cache_ttl
+    directive: str
+    for directive in headers.get("Cache-Control", "").lower().split(","):
+        name: str
+        value: str
+        name, _, value = directive.partition("=")
+        name = name.strip()
+        if name == "no-store":
+            return None
+        if name == "no-cache":
+            lifetime = 0.0
+        elif name == "max-age":
+            try:
+                lifetime = min(lifetime, float(value.strip().strip('"')))
+            except ValueError:
+                lifetime = 0.0
+    return lifetime
+
+
+def _has_serialize_hooks(model_instance: sob.abc.Model) -> bool:
+    hooks: sob.abc.Hooks | None = sob.read_model_hooks(model_instance)
+    return hooks is not None and bool(
+        hooks.before_serialize or hooks.after_serialize
+    )
+
+
+def _serialize(model_instance: sob.abc.Model) -> bytes:
+    """
+    Serialize a model instance as compact, UTF-8 encoded, JSON, using
+    `orjson` if it is installed. Without `orjson`, the standard library's
+    encoder is configured to produce the same output, so that request bodies
+    do not depend on whether `orjson` is installed.
+    """
+    data: typing.Any = sob.marshal(model_instance)
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # For example, integers which exceed 64 bits
+            pass
+    return dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def _get_count_query(datastore_query: _DatastoreQueryT) -> _DatastoreQueryT:
+    """
+    Get a copy of a datastore query which requests only a count of matching
+    rows (as JSON), and not the rows themselves, or the schema.
+    """
+    datastore_query = copy(datastore_query)
+    datastore_query.count = True
+    datastore_query.results = False
+    datastore_query.schema = False
+    datastore_query.format_ = "json"
+    return datastore_query
+
+
+def _get_count(
+    response: model.JsonOrCsvQueryOkContentApplicationJsonSchema | str,
+) -> int:
+    if not isinstance(
+        response, model.JsonOrCsvQueryOkContentApplicationJsonSchema
+    ):
+        raise TypeError(response)
+    if response.count is None:
+        message: str = "The response does not include a count."
+        raise ValueError(message)
+    return response.count
+
+
+_JSON_ARRAY_SEPARATOR: re.Pattern = re.compile(r"[\s,]*")
+_JSON_WHITESPACE: re.Pattern = re.compile(r"\s*")
+# Characters which end a JSON number, `true`, `false` or `null` (when it is an
+# item of an array)
+_JSON_SCALAR_END: re.Pattern = re.compile(r"[\s,\]]")
+# Characters which are significant when scanning a JSON object or array,
+# outside of a string, or within a string
+_JSON_STRUCTURAL: re.Pattern = re.compile(r'[\[\]{}"]')
+_JSON_STRING_SPECIAL: re.Pattern = re.compile(r'["\\]')
+
+
+def _iter_response_text(response: sob.abc.Readable) -> Iterator[str]:
+    """
+    Read and decode a (UTF-8 encoded) response incrementally.
+    """
+    decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(
+        "utf-8"
+    )()
+    data: str | bytes = response.read(JSON_STREAM_READ_SIZE)
+    while data:
+        yield data if isinstance(data, str) else decoder.decode(data)
+        data = response.read(JSON_STREAM_READ_SIZE)
+    yield decoder.decode(b"", final=True)
+
+
+class _JSONArrayItemParser:
+    """
+    An incremental parser for the items of a JSON array.
+
+    Text is passed to `feed` as it is read, and each item is decoded (once)
+    when the text read so far is known to include all of it, so that parsing
+    takes linear time regardless of how items are split across reads. The
+    scanner tracks only nesting depth and whether it is inside a string,
+    leaving validation to `json.JSONDecoder`.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_decoder",
+        "_parts",
+        "_depth",
+        "_in_string",
+        "_escaped",
+        "_scalar",
+        "_started",
+        "_finished",
+    )
+
+    def __init__(self) -> None:
+        self._decoder: JSONDecoder = JSONDecoder()
+        # The text of the item currently being read
+        self._parts: list[str] = []
+        self._depth: int = 0
+        self._in_string: bool = False
+        self._escaped: bool = False
+        self._scalar: bool = False
+        self._started: bool = False
+        self._finished: bool = False
+
+    def feed(self, text: str, *, final: bool = False) -> list[typing.Any]:
+        """
+        Parse `text`, returning any array items which it completes.
+
+        Parameters:
+            text: The next segment of the JSON document.
+            final: If `True`, the document is complete.
+        """
+        items: list[typing.Any] = []
+        position: int = 0
+        length: int = len(text)
+        while position < length:
+            start: int = 0
+            if not self._parts:
+                position = self._skip(text, position)
+                if position == length:
+                    break
+                start = position
+                position = self._start_item(text, position)
+            end: int = self._scan(text, position)
+            if end < 0:
+                self._parts.append(text[start:])
+                break
+            self._parts.append(text[start:end])
+            items.append(self._decode())
+            position = end
+        if final:
+            if self._parts and self._scalar:
+                items.append(self._decode())
+            if not self._finished:
+                message: str = "The JSON array is incomplete."
+                raise ValueError(message)
+        return items
+
+    def _skip(self, text: str, position: int) -> int:
+        """
+        Skip the array's brackets, separators and whitespace, returning the
+        position at which the next item starts (or the length of `text`).
+        """
+        length: int = len(text)
+        message: str
+        while True:
+            if self._finished:
+                if _JSON_WHITESPACE.match(text, position).end() != length:  # type: ignore
+                    message = (
+                        "Unexpected data after the JSON array: "
+                        f"{text[position : position + 80]!r}"
+                    )
+                    raise ValueError(message)
+                return length
+            position = _JSON_ARRAY_SEPARATOR.match(text, position).end()  # type: ignore
+            if position == length:
+                return length
+            if not self._started:
+                if text[position] != "[":
+                    message = (
+                        "Expected a JSON array: "
+                        f"{text[position : position + 80]!r}"
+                    )
+                    raise ValueError(message)
+                self._started = True
+            elif text[position] == "]":
+                self._finished = True
+            else:
+                return position
+            position += 1
+
+    def _start_item(self, text: str, position: int) -> int:
+        """
+        Begin reading an item at `position`, returning the position from
+        which to scan for its end.
+        """
+        character: str = text[position]
+        if character in "[{":
+            self._depth = 1
+            return position + 1
+        if character == '"':
+            self._in_string = True
+            return position + 1
+        self._scalar = True
+        return position
+
+    def _scan(self, text: str, position: int) -> int:
+        """
+        Return the position following the end of the current item, or -1 if
+        the item does not end in `text`.
+        """
+        if self._scalar:
+            scalar_end: re.Match | None = _JSON_SCALAR_END.search(
+                text, position
+            )
+            return -1 if scalar_end is None else scalar_end.start()
+        while True:
+            if self._in_string:
+                position = self._scan_string(text, position)
+                if position < 0 or not self._depth:
+                    return position
+            match: re.Match | None = _JSON_STRUCTURAL.search(text, position)
+            if match is None:
+                return -1
+            position = match.end()
+            character: str = match.group()
+            if character == '"':
+                self._in_string = True
+            elif character in "[{":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if not self._depth:
+                    return position
+
+    def _scan_string(self, text: str, position: int) -> int:
+        """
+        Return the position following the end of the current string, or -1
+        if the string does not end in `text`.
+        """
+        while True:
+            if self._escaped:
+                # Skip the character following a backslash
+                if position >= len(text):
+                    return -1
+                position += 1
+                self._escaped = False
+            match: re.Match | None = _JSON_STRING_SPECIAL.search(
+                text, position
+            )
+            if match is None:
+                return -1
+            position = match.end()
+            if match.group() == "\\":
+                self._escaped = True
+            else:
+                self._in_string = False
+                return position
+
+    def _decode(self) -> typing.Any:
+        text: str = "".join(self._parts)
+        self._parts.clear()
+        self._scalar = False
+        self._depth = 0
+        item: typing.Any
+        end: int
+        item, end = self._decoder.raw_decode(text)
+        if end != len(text):
+            message: str = f"Invalid JSON array item: {text[:80]!r}"
+            raise ValueError(message)
+        return item
+
+
+def _iter_json_array_items(
+    response: sob.abc.Readable,
+) -> Iterator[typing.Any]:
+    """
+    Parse the items of a JSON array incrementally, as a response is read, so
+    that only one item (rather than the entire array) is held in memory at
+    a time. The response is read to the end, and any data following the
+    array is rejected.
+    """
+    parser: _JSONArrayItemParser = _JSONArrayItemParser()
+    text: str
+    for text in _iter_response_text(response):
+        yield from parser.feed(text)
+    yield from parser.feed("", final=True)
+
+
+def _get_dataset_items_query(
+    show_reference_ids: bool | None,
+) -> dict[str, typing.Any]:
+    if show_reference_ids is None:
+        return {}
+    return {
+        "show-reference-ids": oapi.client.format_argument_value(
+            "show-reference-ids",
+            show_reference_ids,
+            style="form",
+            explode=True,
+        )
+    }
+
+
+class Client(oapi.client.Client):
+    """
+    A base class for the CMS Provider Data API client which re-uses
+    persistent (keep-alive) HTTP(S) connections across requests, including
+    requests made concurrently from multiple threads, rather than opening
+    a new connection (and performing a new TLS handshake) for every request.
+
+    Idle connections are closed by calling `close`, or on exiting a
+    `with` block:
+
+    ```python
+    with Client() as client:
+        ...
+    ```
+
+    Parameters:
+        response_cache_ttl: If greater than zero, the bodies of `GET`
+            responses are cached by the client for up to this many seconds
+            (or for less, if a response's `Cache-Control` header so
+            indicates), and stale responses with `ETag` or `Last-Modified`
+            headers are revalidated with a conditional request. By default,
+            responses are not cached.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_pooled_opener",
+        "_oauth2_authorization_lock",
+        "response_cache_ttl",
+        "_response_cache",
+    )
+
+    def __init__(
+        self,
+        *args: typing.Any,
+        response_cache_ttl: float = 0.0,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        # The opener (and its connection pool) is created on first use
+        self._pooled_opener: OpenerDirector | None = None
+        # This ensures only one thread requests an OAuth2 access token
+        # at a time
+        self._oauth2_authorization_lock: Lock = Lock()
+        self.response_cache_ttl: float = response_cache_ttl
+        self._response_cache: _ResponseCache = _ResponseCache()
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        state: dict[str, typing.Any] = super().__getstate__()
+        # The opener, lock and response cache are not pickled: they are
+        # re-created (empty) by `__init__` when the client is un-pickled
+        del (
+            state["_pooled_opener"],
+            state["_oauth2_authorization_lock"],
+            state["_response_cache"],
+        )
+        return state
+
+    def __enter__(self: _ClientT) -> _ClientT:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close this client's idle (keep-alive) connections. The client can
+        still be used after being closed, however subsequent requests will
+        open new connections.
+        """
+        opener: OpenerDirector | None = self._pooled_opener
+        if opener is None:
+            return
+        self._pooled_opener = None
+        handler: typing.Any
+        for handler in opener.handlers:  # type: ignore
+            if isinstance(
+                handler, (_KeepAliveHTTPHandler, _KeepAliveHTTPSHandler)
+            ):
+                handler._connection_pool.close()  # noqa: SLF001
+
+    def request_if_modified(
+        self,
+        path: str,
+        method: str = "GET",
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        headers: collections.abc.Mapping[str, str]
+        | collections.abc.Sequence[tuple[str, str]] = (),
+        timeout: int = 0,
+    ) -> sob.abc.Readable | None:
+        """
+        Send a conditional request, and return the response, or `None` if
+        the resource has not been modified since the `etag` and/or
+        `last_modified` validators were obtained. Errors are retried as
+        configured for this client, except that an HTTP 304 (NOT MODIFIED)
+        response is never retried.
+
+        Parameters:
+            path: A URL, or a path relative to the client's `url`.
+            method: The HTTP method (typically "GET" or "HEAD").
+            etag: The `ETag` header of a previous response, sent as
+                `If-None-Match`.
+            last_modified: The `Last-Modified` header of a previous
+                response, sent as `If-Modified-Since`.
+            headers: Additional request headers.
+            timeout: The request timeout, in seconds.
+        """
+        headers = (
+            *_iter_items(headers),
+            *((("If-None-Match", etag),) if etag else ()),
+            *(
+                (("If-Modified-Since", last_modified),)
+                if last_modified
+                else ()
+            ),
+        )
+        request: typing.Callable[..., sob.abc.Readable] = self._request
+        if self.retry_number_of_attempts > 1:
+            request = retry(
+                errors=self.retry_for_errors,
+                number_of_attempts=self.retry_number_of_attempts,
+                retry_hook=partial(
+                    _retry_unless_not_modified, self.retry_hook
+                ),
+                logger=self.logger,
+            )(request)
+        try:
+            return request(
+                path, method, None, (), (), headers, False, (), timeout
+            )
+        except HTTPError as error:
+            if error.code != HTTPStatus.NOT_MODIFIED:
+                raise
+            # Close the error's (empty) response, releasing its connection
+            with error:
+                return None
+
+    def _request(  # type: ignore
+        self,
+        path: str,
+        method: str,
+        json: typing.Any = None,
+        data: typing.Any = (),
+        query: typing.Any = (),
+        headers: typing.Any = (),
+        multipart: bool = False,  # noqa: FBT001 FBT002
+        multipart_data_headers: typing.Any = (),
+        timeout: int = 0,
+    ) -> sob.abc.Readable:
+        if (
+            self.response_cache_ttl > 0
+            and method.upper() == "GET"
+            and not _has_header(headers, ("range",))
+        ):
+            return self._request_cached(path, query, headers, timeout)
+        return self._request_uncached(
+            path,
+            method,
+            json,
+            data,
+            query,
+            headers,
+            multipart,
+            multipart_data_headers,
+            timeout,
+        )
+
+    def _request_cached(
+        self,
+        path: str,
+        query: typing.Any,
+        headers: typing.Any,
+        timeout: int,
+    ) -> sob.abc.Readable:
+        """
+        Send a `GET` request, or return a copy of a cached response to the
+        same request if it is fresh, or can be revalidated.
+        """
+        key: _ResponseCacheKey = _get_response_cache_key(path, query, headers)
+        cached: _CachedResponse | None = self._response_cache.get(key)
+        now: float = time.monotonic()
+        if cached is not None:
+            if now < cached.expires:
+                return cached.open()
+            # Ask the server to only send the response body if it has
+            # changed
+            etag: str | None = cached.headers.get("ETag")
+            last_modified: str | None = cached.headers.get("Last-Modified")
+            headers = (
+                *_iter_items(headers),
+                *((("If-None-Match", etag),) if etag else ()),
+                *(
+                    (("If-Modified-Since", last_modified),)
+                    if last_modified
+                    else ()
+                ),
+            )
+        lifetime: float | None
+        try:
+            response: typing.Any = self._request_uncached(
+                path, "GET", None, (), query, headers, False, (), timeout
+            )
+        except HTTPError as error:
+            if cached is None or error.code != HTTPStatus.NOT_MODIFIED:
+                raise
+            error.close()
+            lifetime = _get_response_cache_lifetime(
+                error.headers, self.response_cache_ttl
+            )
+            if lifetime is not None:
+                self._response_cache.put(
+                    key,
+                    _CachedResponse(
+                        cached.data,
+                        cached.status,
+                        cached.reason,
+                        cached.headers,
+                        cached.url,
+                        now + lifetime,
+                    ),
+                )
+            return cached.open()
+        lifetime = _get_response_cache_lifetime(
+            response.headers, self.response_cache_ttl
+        )
+        content_length: str | None = response.headers.get("Content-Length")
+        if lifetime is None or (
+            content_length
+            and content_length.isdigit()
+            and int(content_length) > RESPONSE_CACHE_MAX_CONTENT_LENGTH
+        ):
+            return response
+        with response:
+            data: bytes = response.read()
+        cached = _CachedResponse(
+            data,
+            response.status,
+            response.reason,
+            response.headers,
+            response.url,
+            now + lifetime,
+        )
+        self._response_cache.put(key, cached)
+        return cached.open()
+
+    def _request_uncached(
+        self,
+        path: str,
+        method: str,
+        json: typing.Any,
+        data: typing.Any,
+        query: typing.Any,
+        headers: typing.Any,
+        multipart: bool,  # noqa: FBT001
+        multipart_data_headers: typing.Any,
+        timeout: int,
+    ) -> sob.abc.Readable:
+        # Compressed responses are requested unless the request is for
+        # headers only (`HEAD`), or for a byte range (which would refer to
+        # the encoded content), or a content encoding is specified already
+        accept_encoding: bool = not (
+            method.upper() == "HEAD"
+            or _has_header(self.headers, ("accept-encoding", "range"))
+            or _has_header(headers, ("accept-encoding", "range"))
+        )
+        if isinstance(json, sob.abc.Model) and not _has_serialize_hooks(json):
+            json = _serialize(json)
+        if accept_encoding:
+            headers = (
+                *_iter_items(headers),
+                ("Accept-Encoding", ACCEPT_ENCODING),
+            )
+        response: sob.abc.Readable = super()._request(
+            path,
+            method,
+            json,
+            data,
+            query,
+            headers,
+            multipart,
+            multipart_data_headers,
+            timeout,
+        )
+        if (
+            accept_encoding
+            and isinstance(response, HTTPResponse)
+            and _is_gzip_encoded(response.headers)
+        ):
+            # Responses are only represented (which requires their content
+            # to be copied) if they will be echoed or logged
+            return _GzipDecodedResponse(  # type: ignore
+                response,
+                (
+                    self._get_request_response_callback()
+                    if self.echo or self.logger is not None
+                    else None
+                ),
+            )
+        return response
+
+    @staticmethod
+    def _deserialize(response: sob.abc.Readable) -> typing.Any:
+        """
+        Deserialize a JSON response, using `orjson` when it is installed.
+        """
+        data: str | bytes = response.read()
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # Defer to `sob` for JSON which `orjson` rejects (such as
+                # strings with un-escaped control characters), or to
+                # raise an appropriate error
+                pass
+        return sob.deserialize(data)
+
+    def _get_oauth2_client_credentials_authorization(self) -> str:
+        return self._get_locked_oauth2_authorization(
+            super()._get_oauth2_client_credentials_authorization
+        )
+
+    def _get_oauth2_password_authorization(self) -> str:
+        return self._get_locked_oauth2_authorization(
+            super()._get_oauth2_password_authorization
+        )
+
+    def _get_locked_oauth2_authorization(
+        self, get_authorization: typing.Callable[[], str]
+    ) -> str:
+        """
+        Get an OAuth2 authorization header value, requesting a new access
+        token only if the cached token has expired (or is about to), and
+        only from one thread at a time.
+        """
+        with self._oauth2_authorization_lock:
+            expires: int = self._oauth2_authorization_expires
+            authorization: str = get_authorization()
+            if self._oauth2_authorization_expires != expires:
+                # A new access token was issued, so schedule its refresh
+                # ahead of its expiration, to avoid sending requests with
+                # an access token which expires while they are in flight
+                lifetime: int = self._oauth2_authorization_expires - int(
+                    time.time()
+                )
+                self._oauth2_authorization_expires -= min(
+                    OAUTH2_AUTHORIZATION_REFRESH_MARGIN, lifetime // 2
+                )
+            return authorization
+
+    def map_datastore_query_distributions(
+        self,
+        distribution_ids: Iterable[str],
+        *,
+        max_workers: int = MAP_MAX_WORKERS,
+        **kwargs: typing.Any,
+    ) -> list[model.JsonOrCsvQueryOkContentApplicationJsonSchema | str]:
+        """
+        Query multiple distributions concurrently, using up to `max_workers`
+        threads (which share this client's keep-alive connections), and
+        return the results in the same order as `distribution_ids`.
+
+        Parameters:
+            distribution_ids: Distribution IDs
+            max_workers: The maximum number of concurrent requests
+            **kwargs: Keyword arguments for
+                `get_datastore_query_distribution_id`, applied to every
+                distribution.
+        """
+        executor: ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    partial(
+                        self.get_datastore_query_distribution_id,  # type: ignore
+                        **kwargs,
+                    ),
+                    distribution_ids,
+                )
+            )
+
+    def post_datastore_queries(
+        self,
+        datastore_queries: Iterable[model.DatastoreQuery],
+        *,
+        max_workers: int = MAP_MAX_WORKERS,
+    ) -> list[model.JsonOrCsvQueryOkContentApplicationJsonSchema | str]:
+        """
+        Send multiple datastore queries concurrently, using up to
+        `max_workers` threads (which share this client's keep-alive
+        connections), and return the results in the same order as
+        `datastore_queries`.
+
+        Independent queries cannot be combined into a single request: a
+        datastore query listing multiple resources performs a join.
+
+        Parameters:
+            datastore_queries: Datastore queries
+            max_workers: The maximum number of concurrent requests
+        """
+        executor: ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    self.post_datastore_query,  # type: ignore
+                    datastore_queries,
+                )
+            )
+
+    def map_search_pages(
+        self,
+        pages: Iterable[int],
+        *,
+        max_workers: int = MAP_MAX_WORKERS,
+        **kwargs: typing.Any,
+    ) -> list[model.SearchGetResponse]:
+        """
+        Get multiple pages of search results concurrently, using up to
+        `max_workers` threads (which share this client's keep-alive
+        connections), and return the pages in the same order as `pages`.
+
+        Parameters:
+            pages: Page numbers
+            max_workers: The maximum number of concurrent requests
+            **kwargs: Keyword arguments for `get_search` (other than
+                `page`), applied to every page.
+        """
+
+        def get_page(page: int) -> model.SearchGetResponse:
+            return self.get_search(page=page, **kwargs)  # type: ignore
+
+        executor: ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(get_page, pages))
+
+    def map_metastore_schemas_dataset_items_identifiers(
+        self,
+        identifiers: Iterable[str],
+        *,
+        max_workers: int = MAP_MAX_WORKERS,
+        **kwargs: typing.Any,
+    ) -> list[model.Dataset]:
+        """
+        Get multiple datasets concurrently, using up to `max_workers`
+        threads (which share this client's keep-alive connections), and
+        return the datasets in the same order as `identifiers`.
+
+        Parameters:
+            identifiers: Dataset identifiers
+            max_workers: The maximum number of concurrent requests
+            **kwargs: Keyword arguments for
+                `get_metastore_schemas_dataset_items_identifier`, applied to
+                every dataset.
+        """
+        executor: ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    partial(
+                        self.get_metastore_schemas_dataset_items_identifier,  # type: ignore
+                        **kwargs,
+                    ),
+                    identifiers,
+                )
+            )
+
+    def count_datastore_query(
+        self, datastore_query: model.DatastoreQuery
+    ) -> int:
+        """
+        Get the number of rows matching a datastore query. Only the count is
+        requested, so the matching rows (and the schema) are not sent.
+
+        Parameters:
+            datastore_query: A datastore query. This is not modified: the
+                count is requested using a copy of the query.
+        """
+        return _get_count(
+            self.post_datastore_query(  # type: ignore
+                _get_count_query(datastore_query)
+            )
+        )
+
+    def count_datastore_query_distribution(
+        self,
+        distribution_id: str,
+        datastore_resource_query: model.DatastoreResourceQuery | None = None,
+    ) -> int:
+        """
+        Get the number of rows in a distribution, or the number matching a
+        datastore resource query. Only the count is requested, so the
+        matching rows (and the schema) are not sent.
+
+        Parameters:
+            distribution_id: A distribution ID
+            datastore_resource_query: A datastore resource query (with
+                conditions to match, for example). This is not modified:
+                the count is requested using a copy of the query.
+        """
+        if datastore_resource_query is None:
+            return _get_count(
+                self.get_datastore_query_distribution_id(  # type: ignore
+                    distribution_id, count=True, results=False, schema=False
+                )
+            )
+        return _get_count(
+            self.post_datastore_query_distribution_id(  # type: ignore
+                _get_count_query(datastore_resource_query), distribution_id
+            )
+        )
+
+    def iter_metastore_schemas_dataset_items(
+        self,
+        *,
+        show_reference_ids: bool | None = None,
+    ) -> Iterator[model.Dataset]:
+        """
+        Yield all datasets, parsing each as it is read from the response.
+        Unlike `get_metastore_schemas_dataset_items`, this does not hold
+        the entire response (and every dataset parsed from it) in memory
+        at once.
+
+        Parameters:
+            show_reference_ids: Show datastore reference IDs.
+        """
+        response: sob.abc.Readable
+        with self.request(  # type: ignore
+            "/metastore/schemas/dataset/items",
+            method="GET",
+            query=_get_dataset_items_query(show_reference_ids),
+        ) as response:
+            item: typing.Any
+            for item in _iter_json_array_items(response):
+                yield sob.unmarshal(item, types=(model.Dataset,))  # type: ignore
+
+    @property
+    def _opener(self) -> OpenerDirector:
+        # This overrides the opener through which `oapi.client.Client` sends
+        # all requests
+        if self._pooled_opener is None:
+            connection_pool: _ConnectionPool = _ConnectionPool()
+            self._pooled_opener = build_opener(
+                _KeepAliveHTTPHandler(connection_pool),
+                _KeepAliveHTTPSHandler(
+                    connection_pool,
+                    # This is the same SSL context as is used by
+                    # `oapi.client.Client`, which loads the default CA
+                    # certificates, or disables certificate verification
+                    # if `verify_ssl_certificate` is `False`
+                    context=SSLContext(
+                        check_hostname=self.verify_ssl_certificate  # type: ignore
+                    ),
+                ),
+                HTTPCookieProcessor(self._cookie_jar),
+                _GzipErrorProcessor(),
+            )
+        return self._pooled_opener
+
+
+class AsyncClient(Client):
+    """
+    A base class for the asynchronous CMS Provider Data API client.
+
+    Each request is sent, and its response read in full, in one of the
+    client's worker threads (up to one per connection retained by the
+    client's connection pool), so that any number of requests can be
+    awaited concurrently, sharing the client's pool of keep-alive
+    connections, without blocking the event loop. The exception is
+    `iter_metastore_schemas_dataset_items`, which reads its response
+    incrementally.
+    """
+
+    __slots__: tuple[str, ...] = ("_executor",)
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        state: dict[str, typing.Any] = super().__getstate__()
+        del state["_executor"]
+        return state
+
+    def close(self) -> None:
+        """
+        Close this client's idle (keep-alive) connections, and shut down
+        its worker threads once requests in flight have completed. The
+        client can still be used after being closed, however subsequent
+        requests will open new connections and threads.
+        """
+        super().close()
+        executor: ThreadPoolExecutor | None = self._executor
+        if executor is not None:
+            self._executor = None
+            executor.shutdown(wait=False)
+
+    async def aclose(self) -> None:
+        """
+        Close this client (see `close`) without blocking the event loop.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __aenter__(self: _ClientT) -> _ClientT:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+    async def request(  # type: ignore
+        self,
+        path: str,
+        method: str,
+        **kwargs: typing.Any,
+    ) -> sob.abc.Readable:
+        """
+        Send a request, and return the (fully read) response.
+
+        Parameters:
+            path: A URL, or a path relative to the client's `url`.
+            method: The HTTP method.
+            **kwargs: Additional keyword arguments for
+                `oapi.client.Client.request`.
+        """
+        return await self._run(self._request_and_read, path, method, **kwargs)
+
+    async def request_if_modified(  # type: ignore
+        self,
+        path: str,
+        method: str = "GET",
+        **kwargs: typing.Any,
+    ) -> sob.abc.Readable | None:
+        """
+        Send a conditional request, and return the (fully read) response,
+        with its status and headers, or `None` if the resource has not been
+        modified.
+
+        Parameters:
+            path: A URL, or a path relative to the client's `url`.
+            method: The HTTP method (typically "GET" or "HEAD").
+            **kwargs: Additional keyword arguments for
+                `Client.request_if_modified`.
+        """
+        return await self._run(
+            self._request_if_modified_and_read, path, method, **kwargs
+        )
+
+    async def _run(
+        self,
+        function: typing.Callable[..., _T],
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> _T:
+        """
+        Call `function` in one of this client's worker threads.
+        """
+        if self._executor is None:
+            # The event loop's default executor may have fewer threads than
+            # connections which could be used concurrently
+            self._executor = ThreadPoolExecutor(
+                max_workers=CONNECTION_POOL_MAXSIZE
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            partial(
+                # As with `asyncio.to_thread`, context variables are
+                # propagated to the worker thread
+                copy_context().run,
+                function,
+                *args,
+                **kwargs,
+            ),
+        )
+
+    async def map_datastore_query_distributions(  # type: ignore
+        self,
+        distribution_ids: Iterable[str],
+        *,
+        max_workers: int = MAP_MAX_WORKERS,
+        **kwargs: typing.Any,
+    ) -> list[model.JsonOrCsvQueryOkContentApplicationJsonSchema | str]:
+        """
+        Query multiple distributions concurrently, with up to `max_workers`
+        requests in flight at once, and return the results in the same
+        order as `distribution_ids`.
+
+        Parameters:
+            distribution_ids: Distribution IDs
+            max_workers: The maximum number of concurrent requests
+            **kwargs: Keyword arguments for
+                `get_datastore_query_distribution_id`, applied to every
+                distribution.
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max_workers)
+
+        async def get_distribution(
+            distribution_id: str,
+        ) -> model.JsonOrCsvQueryOkContentApplicationJsonSchema | str:
+            async with semaphore:
+                return await self.get_datastore_query_distribution_id(  # type: ignore
+                    distribution_id, **kwargs
+                )
+
+        return list(
+            await asyncio.gather(*map(get_distribution, distribution_ids))
+        )
+
+    async def post_datastore_queries(  # type: ignore
+        self,
+        datastore_queries: Iterable[model.DatastoreQuery],
+        *,
+        max_workers: int = MAP_MAX_WORKERS,
+    ) -> list[model.JsonOrCsvQueryOkContentApplicationJsonSchema | str]:
+        """
+        Send multiple datastore queries concurrently, with up to
+        `max_workers` requests in flight at once, and return the results in
+        the same order as `datastore_queries`.
+
+        Parameters:
+            datastore_queries: Datastore queries
+            max_workers: The maximum number of concurrent requests
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max_workers)
+
+        async def post_query(
+            datastore_query: model.DatastoreQuery,
+        ) -> model.JsonOrCsvQueryOkContentApplicationJsonSchema | str:
+            async with semaphore:
+                return await self.post_datastore_query(  # type: ignore
+                    datastore_query
+                )
+
+        return list(await asyncio.gather(*map(post_query, datastore_queries)))
+
+    async def map_search_pages(  # type: ignore
+        self,
+        pages: Iterable[int],
+        *,
+        max_workers: int = MAP_MAX_WORKERS,
+        **kwargs: typing.Any,
+    ) -> list[model.SearchGetResponse]:
+        """
+        Get multiple pages of search results concurrently, with up to
+        `max_workers` requests in flight at once, and return the pages in
+        the same order as `pages`.
+
+        Parameters:
+            pages: Page numbers
+            max_workers: The maximum number of concurrent requests
+            **kwargs: Keyword arguments for `get_search` (other than
+                `page`), applied to every page.
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max_workers)
+
+        async def get_page(page: int) -> model.SearchGetResponse:
+            async with semaphore:
+                return await self.get_search(  # type: ignore
+                    page=page, **kwargs
+                )
+
+        return list(await asyncio.gather(*map(get_page, pages)))
+
+    async def map_metastore_schemas_dataset_items_identifiers(  # type: ignore
+        self,
+        identifiers: Iterable[str],
+        *,
+        max_workers: int = MAP_MAX_WORKERS,
+        **kwargs: typing.Any,
+    ) -> list[model.Dataset]:
+        """
+        Get multiple datasets concurrently, with up to `max_workers`
+        requests in flight at once, and return the datasets in the same
+        order as `identifiers`.
+
+        Parameters:
+            identifiers: Dataset identifiers
+            max_workers: The maximum number of concurrent requests
+            **kwargs: Keyword arguments for
+                `get_metastore_schemas_dataset_items_identifier`, applied to
+                every dataset.
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max_workers)
+
+        async def get_dataset(identifier: str) -> model.Dataset:
+            async with semaphore:
+                return (
+                    await self.get_metastore_schemas_dataset_items_identifier(  # type: ignore
+                        identifier, **kwargs
+                    )
+                )
+
+        return list(await asyncio.gather(*map(get_dataset, identifiers)))
+
+    async def count_datastore_query(  # type: ignore
+        self, datastore_query: model.DatastoreQuery
+    ) -> int:
+        """
+        Get the number of rows matching a datastore query. Only the count is
+        requested, so the matching rows (and the schema) are not sent.
+
+        Parameters:
+            datastore_query: A datastore query. This is not modified: the
+                count is requested using a copy of the query.
+        """
+        return _get_count(
+            await self.post_datastore_query(  # type: ignore
+                _get_count_query(datastore_query)
+            )
+        )
+
+    async def count_datastore_query_distribution(  # type: ignore
+        self,
+        distribution_id: str,
+        datastore_resource_query: model.DatastoreResourceQuery | None = None,
+    ) -> int:
+        """
+        Get the number of rows in a distribution, or the number matching a
+        datastore resource query. Only the count is requested, so the
+        matching rows (and the schema) are not sent.
+
+        Parameters:
+            distribution_id: A distribution ID
+            datastore_resource_query: A datastore resource query (with
+                conditions to match, for example). This is not modified:
+                the count is requested using a copy of the query.
+        """
+        if datastore_resource_query is None:
+            return _get_count(
+                await self.get_datastore_query_distribution_id(  # type: ignore
+                    distribution_id, count=True, results=False, schema=False
+                )
+            )
+        return _get_count(
+            await self.post_datastore_query_distribution_id(  # type: ignore
+                _get_count_query(datastore_resource_query), distribution_id
+            )
+        )
+
+    async def iter_metastore_schemas_dataset_items(  # type: ignore
+        self,
+        *,
+        show_reference_ids: bool | None = None,
+    ) -> AsyncIterator[model.Dataset]:
+        """
+        Yield all datasets, parsing each as it is read from the response.
+        Unlike `get_metastore_schemas_dataset_items`, this does not hold
+        the entire response (and every dataset parsed from it) in memory
+        at once: the response is read incrementally, in this client's
+        worker threads.
+
+        Parameters:
+            show_reference_ids: Show datastore reference IDs.
+        """
+        response: sob.abc.Readable = await self._run(
+            super().request,
+            "/metastore/schemas/dataset/items",
+            method="GET",
+            query=_get_dataset_items_query(show_reference_ids),
+        )
+        parser: _JSONArrayItemParser = _JSONArrayItemParser()
+        decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(
+            "utf-8"
+        )()
+        item: typing.Any
+        try:
+            data: str | bytes = await self._run(
+                response.read, JSON_STREAM_READ_SIZE
+            )
+            while data:
+                for item in parser.feed(
+                    data if isinstance(data, str) else decoder.decode(data)
+                ):
+                    yield sob.unmarshal(item, types=(model.Dataset,))  # type: ignore
+                data = await self._run(response.read, JSON_STREAM_READ_SIZE)
+            for item in parser.feed(
+                decoder.decode(b"", final=True), final=True
+            ):
+                yield sob.unmarshal(item, types=(model.Dataset,))  # type: ignore
+        finally:
+            response.close()  # type: ignore
+
+    def _request_if_modified_and_read(
+        self,
+        path: str,
+        method: str,
+        **kwargs: typing.Any,
+    ) -> sob.abc.Readable | None:
+        response: typing.Any = super().request_if_modified(
+            path, method, **kwargs
+        )
+        if response is None:
+            return None
+        with response:
+            return _CachedResponse(
+                response.read(),
+                response.status,
+                response.reason,
+                response.headers,
+                response.url,
+                0.0,
+            ).open()
+
+    def _request_and_read(
+        self,
+        path: str,
+        method: str,
+        **kwargs: typing.Any,
+    ) -> sob.abc.Readable:
+        response: HTTPResponse
+        with super().request(path, method, **kwargs) as response:  # type: ignore
+            return BytesIO(response.read())  # type: ignore
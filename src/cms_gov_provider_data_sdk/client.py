@@ -1,14 +1,34 @@
 from __future__ import annotations
-
 import collections.abc
+import functools
 import oapi
 import sob
 import typing
 from . import model
+from ._base import Client as _Client
 from logging import Logger
 
+_STRING_PROPERTY = sob.StringProperty()
+_format_deep_object_explode = functools.partial(
+    oapi.client.format_argument_value,
+    style="deepObject",
+    explode=True,
+)
+_format_form = functools.partial(
+    oapi.client.format_argument_value,
+    style="form",
+    explode=False,
+)
+_format_form_explode = functools.partial(
+    oapi.client.format_argument_value,
+    style="form",
+    explode=True,
+)
+
+
+class Client(_Client):
 
-class Client(oapi.client.Client):
+    __slots__: tuple[str, ...] = ()
 
     def __init__(
         self,
@@ -61,6 +81,7 @@ class Client(oapi.client.Client):
         verify_ssl_certificate: bool = True,
         logger: Logger | None = None,
         echo: bool = False,
+        response_cache_ttl: float = 0.0,
     ) -> None:
         """
         Parameters:
@@ -114,6 +135,12 @@ class Client(oapi.client.Client):
                 A `logging.Logger` to which requests should be logged.
             echo: If `True`, requests/responses are printed as
                 they occur.
+            response_cache_ttl: If greater than zero, the bodies of `GET`
+                responses are cached by the client for up to this many seconds
+                (or for less, if a response's `Cache-Control` header so
+                indicates), and stale responses with `ETag` or `Last-Modified`
+                headers are revalidated with a conditional request. By default,
+                responses are not cached.
         """
 
         super().__init__(
@@ -142,6 +169,7 @@ class Client(oapi.client.Client):
             verify_ssl_certificate=verify_ssl_certificate,
             logger=logger,
             echo=echo,
+            response_cache_ttl=response_cache_ttl,
         )
 
     def get_datastore_imports(
@@ -156,7 +184,7 @@ class Client(oapi.client.Client):
             method="GET",
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 sob.Dictionary,
             )
@@ -180,7 +208,7 @@ class Client(oapi.client.Client):
             json=datastore_imports_post_request_body_content_application_json_schema,  # noqa: E501
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 sob.Dictionary,
             )
@@ -201,18 +229,14 @@ class Client(oapi.client.Client):
                 datastore/imports.
         """
         response: sob.abc.Readable = self.request(
-            "/datastore/imports/{identifier}".format(**{
-                "identifier": str(oapi.client.format_argument_value(
-                    "identifier",
-                    identifier,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/datastore/imports/"
+                f"{identifier}"
+            ),
             method="GET",
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.DatastoreImportsIdentifierGetResponse,
             )
@@ -234,18 +258,14 @@ class Client(oapi.client.Client):
                 datastore/imports.
         """
         response: sob.abc.Readable = self.request(
-            "/datastore/imports/{identifier}".format(**{
-                "identifier": str(oapi.client.format_argument_value(
-                    "identifier",
-                    identifier,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/datastore/imports/"
+                f"{identifier}"
+            ),
             method="DELETE",
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.DatastoreImportsIdentifierDeleteResponse,
             )
@@ -287,61 +307,25 @@ class Client(oapi.client.Client):
             "/datastore/query",
             method="GET",
             query={
-                "limit": oapi.client.format_argument_value(
-                    "limit",
-                    limit,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "offset": oapi.client.format_argument_value(
-                    "offset",
-                    offset,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "count": oapi.client.format_argument_value(
-                    "count",
-                    count,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "results": oapi.client.format_argument_value(
-                    "results",
-                    results,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "schema": oapi.client.format_argument_value(
-                    "schema",
-                    schema,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "keys": oapi.client.format_argument_value(
-                    "keys",
-                    keys,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "format": oapi.client.format_argument_value(
-                    "format",
-                    format,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "rowIds": oapi.client.format_argument_value(
-                    "rowIds",
-                    row_ids,
-                    style="deepObject",
-                    explode=True,
-                ),
+                name: format_argument_value(name, value)
+                for name, format_argument_value, value in (
+                    ("limit", _format_deep_object_explode, limit),
+                    ("offset", _format_deep_object_explode, offset),
+                    ("count", _format_deep_object_explode, count),
+                    ("results", _format_deep_object_explode, results),
+                    ("schema", _format_deep_object_explode, schema),
+                    ("keys", _format_deep_object_explode, keys),
+                    ("format", _format_deep_object_explode, format),
+                    ("rowIds", _format_deep_object_explode, row_ids),
+                )
+                if value is not None
             },
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.JsonOrCsvQueryOkContentApplicationJsonSchema,
-                sob.StringProperty(),
+                _STRING_PROPERTY,
             )
         )
 
@@ -366,10 +350,10 @@ class Client(oapi.client.Client):
             json=datastore_query,
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.JsonOrCsvQueryOkContentApplicationJsonSchema,
-                sob.StringProperty(),
+                _STRING_PROPERTY,
             )
         )
 
@@ -406,61 +390,25 @@ class Client(oapi.client.Client):
             "/datastore/query/download",
             method="GET",
             query={
-                "limit": oapi.client.format_argument_value(
-                    "limit",
-                    limit,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "offset": oapi.client.format_argument_value(
-                    "offset",
-                    offset,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "count": oapi.client.format_argument_value(
-                    "count",
-                    count,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "results": oapi.client.format_argument_value(
-                    "results",
-                    results,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "schema": oapi.client.format_argument_value(
-                    "schema",
-                    schema,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "keys": oapi.client.format_argument_value(
-                    "keys",
-                    keys,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "format": oapi.client.format_argument_value(
-                    "format",
-                    format,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "rowIds": oapi.client.format_argument_value(
-                    "rowIds",
-                    row_ids,
-                    style="deepObject",
-                    explode=True,
-                ),
+                name: format_argument_value(name, value)
+                for name, format_argument_value, value in (
+                    ("limit", _format_deep_object_explode, limit),
+                    ("offset", _format_deep_object_explode, offset),
+                    ("count", _format_deep_object_explode, count),
+                    ("results", _format_deep_object_explode, results),
+                    ("schema", _format_deep_object_explode, schema),
+                    ("keys", _format_deep_object_explode, keys),
+                    ("format", _format_deep_object_explode, format),
+                    ("rowIds", _format_deep_object_explode, row_ids),
+                )
+                if value is not None
             },
         )
-        return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
-            types=(
-                sob.StringProperty(),
-            )
+        data: str | bytes = response.read()
+        return (
+            data
+            if isinstance(data, str)
+            else str(data, encoding="utf-8")
         )
 
     def post_datastore_query_download(
@@ -480,11 +428,11 @@ class Client(oapi.client.Client):
             method="POST",
             json=datastore_query,
         )
-        return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
-            types=(
-                sob.StringProperty(),
-            )
+        data: str | bytes = response.read()
+        return (
+            data
+            if isinstance(data, str)
+            else str(data, encoding="utf-8")
         )
 
     def get_datastore_query_distribution_id(
@@ -522,71 +470,31 @@ class Client(oapi.client.Client):
             row_ids:
         """
         response: sob.abc.Readable = self.request(
-            "/datastore/query/{distributionId}".format(**{
-                "distributionId": str(oapi.client.format_argument_value(
-                    "distributionId",
-                    distribution_id,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/datastore/query/"
+                f"{distribution_id}"
+            ),
             method="GET",
             query={
-                "limit": oapi.client.format_argument_value(
-                    "limit",
-                    limit,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "offset": oapi.client.format_argument_value(
-                    "offset",
-                    offset,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "count": oapi.client.format_argument_value(
-                    "count",
-                    count,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "results": oapi.client.format_argument_value(
-                    "results",
-                    results,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "schema": oapi.client.format_argument_value(
-                    "schema",
-                    schema,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "keys": oapi.client.format_argument_value(
-                    "keys",
-                    keys,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "format": oapi.client.format_argument_value(
-                    "format",
-                    format,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "rowIds": oapi.client.format_argument_value(
-                    "rowIds",
-                    row_ids,
-                    style="deepObject",
-                    explode=True,
-                ),
+                name: format_argument_value(name, value)
+                for name, format_argument_value, value in (
+                    ("limit", _format_deep_object_explode, limit),
+                    ("offset", _format_deep_object_explode, offset),
+                    ("count", _format_deep_object_explode, count),
+                    ("results", _format_deep_object_explode, results),
+                    ("schema", _format_deep_object_explode, schema),
+                    ("keys", _format_deep_object_explode, keys),
+                    ("format", _format_deep_object_explode, format),
+                    ("rowIds", _format_deep_object_explode, row_ids),
+                )
+                if value is not None
             },
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.JsonOrCsvQueryOkContentApplicationJsonSchema,
-                sob.StringProperty(),
+                _STRING_PROPERTY,
             )
         )
 
@@ -611,22 +519,18 @@ class Client(oapi.client.Client):
             distribution_id: A distribution ID
         """
         response: sob.abc.Readable = self.request(
-            "/datastore/query/{distributionId}".format(**{
-                "distributionId": str(oapi.client.format_argument_value(
-                    "distributionId",
-                    distribution_id,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/datastore/query/"
+                f"{distribution_id}"
+            ),
             method="POST",
             json=datastore_resource_query,
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.JsonOrCsvQueryOkContentApplicationJsonSchema,
-                sob.StringProperty(),
+                _STRING_PROPERTY,
             )
         )
 
@@ -669,77 +573,33 @@ class Client(oapi.client.Client):
             row_ids:
         """
         response: sob.abc.Readable = self.request(
-            "/datastore/query/{datasetId}/{index}".format(**{
-                "datasetId": str(oapi.client.format_argument_value(
-                    "datasetId",
-                    dataset_id,
-                    style="simple",
-                    explode=False,
-                )),
-                "index": str(oapi.client.format_argument_value(
-                    "index",
-                    index,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/datastore/query/"
+                f"{dataset_id}"
+                "/"
+                f"{index}"
+            ),
             method="GET",
             query={
-                "limit": oapi.client.format_argument_value(
-                    "limit",
-                    limit,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "offset": oapi.client.format_argument_value(
-                    "offset",
-                    offset,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "count": oapi.client.format_argument_value(
-                    "count",
-                    count,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "results": oapi.client.format_argument_value(
-                    "results",
-                    results,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "schema": oapi.client.format_argument_value(
-                    "schema",
-                    schema,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "keys": oapi.client.format_argument_value(
-                    "keys",
-                    keys,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "format": oapi.client.format_argument_value(
-                    "format",
-                    format,
-                    style="deepObject",
-                    explode=True,
-                ),
-                "rowIds": oapi.client.format_argument_value(
-                    "rowIds",
-                    row_ids,
-                    style="deepObject",
-                    explode=True,
-                ),
+                name: format_argument_value(name, value)
+                for name, format_argument_value, value in (
+                    ("limit", _format_deep_object_explode, limit),
+                    ("offset", _format_deep_object_explode, offset),
+                    ("count", _format_deep_object_explode, count),
+                    ("results", _format_deep_object_explode, results),
+                    ("schema", _format_deep_object_explode, schema),
+                    ("keys", _format_deep_object_explode, keys),
+                    ("format", _format_deep_object_explode, format),
+                    ("rowIds", _format_deep_object_explode, row_ids),
+                )
+                if value is not None
             },
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.JsonOrCsvQueryOkContentApplicationJsonSchema,
-                sob.StringProperty(),
+                _STRING_PROPERTY,
             )
         )
 
@@ -768,28 +628,20 @@ class Client(oapi.client.Client):
                 have an index of "0," the second would have "1", etc.
         """
         response: sob.abc.Readable = self.request(
-            "/datastore/query/{datasetId}/{index}".format(**{
-                "datasetId": str(oapi.client.format_argument_value(
-                    "datasetId",
-                    dataset_id,
-                    style="simple",
-                    explode=False,
-                )),
-                "index": str(oapi.client.format_argument_value(
-                    "index",
-                    index,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/datastore/query/"
+                f"{dataset_id}"
+                "/"
+                f"{index}"
+            ),
             method="POST",
             json=datastore_resource_query,
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.JsonOrCsvQueryOkContentApplicationJsonSchema,
-                sob.StringProperty(),
+                _STRING_PROPERTY,
             )
         )
 
@@ -809,29 +661,25 @@ class Client(oapi.client.Client):
             format: Response format. Currently, only csv is supported.
         """
         response: sob.abc.Readable = self.request(
-            "/datastore/query/{distributionId}/download".format(**{
-                "distributionId": str(oapi.client.format_argument_value(
-                    "distributionId",
-                    distribution_id,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/datastore/query/"
+                f"{distribution_id}"
+                "/download"
+            ),
             method="GET",
             query={
-                "format": oapi.client.format_argument_value(
-                    "format",
-                    format,
-                    style="deepObject",
-                    explode=True,
-                ),
+                name: format_argument_value(name, value)
+                for name, format_argument_value, value in (
+                    ("format", _format_deep_object_explode, format),
+                )
+                if value is not None
             },
         )
-        return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
-            types=(
-                sob.StringProperty(),
-            )
+        data: str | bytes = response.read()
+        return (
+            data
+            if isinstance(data, str)
+            else str(data, encoding="utf-8")
         )
 
     def get_datastore_query_dataset_id__index__download(
@@ -854,35 +702,27 @@ class Client(oapi.client.Client):
             format: Response format. Currently, only csv is supported.
         """
         response: sob.abc.Readable = self.request(
-            "/datastore/query/{datasetId}/{index}/download".format(**{
-                "datasetId": str(oapi.client.format_argument_value(
-                    "datasetId",
-                    dataset_id,
-                    style="simple",
-                    explode=False,
-                )),
-                "index": str(oapi.client.format_argument_value(
-                    "index",
-                    index,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/datastore/query/"
+                f"{dataset_id}"
+                "/"
+                f"{index}"
+                "/download"
+            ),
             method="GET",
             query={
-                "format": oapi.client.format_argument_value(
-                    "format",
-                    format,
-                    style="deepObject",
-                    explode=True,
-                ),
+                name: format_argument_value(name, value)
+                for name, format_argument_value, value in (
+                    ("format", _format_deep_object_explode, format),
+                )
+                if value is not None
             },
         )
-        return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
-            types=(
-                sob.StringProperty(),
-            )
+        data: str | bytes = response.read()
+        return (
+            data
+            if isinstance(data, str)
+            else str(data, encoding="utf-8")
         )
 
     def get_datastore_sql(
@@ -927,22 +767,16 @@ class Client(oapi.client.Client):
             "/datastore/sql",
             method="GET",
             query={
-                "query": oapi.client.format_argument_value(
-                    "query",
-                    query,
-                    style="form",
-                    explode=True,
-                ),
-                "show_db_columns": oapi.client.format_argument_value(
-                    "show_db_columns",
-                    show_db_columns,
-                    style="form",
-                    explode=True,
-                ),
+                name: format_argument_value(name, value)
+                for name, format_argument_value, value in (
+                    ("query", _format_form_explode, query),
+                    ("show_db_columns", _format_form_explode, show_db_columns),
+                )
+                if value is not None
             },
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.DatastoreSqlGetResponse,
             )
@@ -959,7 +793,7 @@ class Client(oapi.client.Client):
             method="GET",
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.HarvestPlansGetResponse,
             )
@@ -983,7 +817,7 @@ class Client(oapi.client.Client):
             json=harvest_plan,
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.HarvestPlansPostResponse,
             )
@@ -1000,18 +834,14 @@ class Client(oapi.client.Client):
             plan_id: A harvest plan identifier
         """
         response: sob.abc.Readable = self.request(
-            "/harvest/plans/{plan_id}".format(**{
-                "plan_id": str(oapi.client.format_argument_value(
-                    "plan_id",
-                    plan_id,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/harvest/plans/"
+                f"{plan_id}"
+            ),
             method="GET",
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.HarvestPlan,
             )
@@ -1028,18 +858,14 @@ class Client(oapi.client.Client):
             run_id: A harvest run identifier
         """
         response: sob.abc.Readable = self.request(
-            "/harvest/runs/{run_id}".format(**{
-                "run_id": str(oapi.client.format_argument_value(
-                    "run_id",
-                    run_id,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/harvest/runs/"
+                f"{run_id}"
+            ),
             method="GET",
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 sob.Dictionary,
             )
@@ -1060,16 +886,15 @@ class Client(oapi.client.Client):
             "/harvest/runs",
             method="GET",
             query={
-                "plan": oapi.client.format_argument_value(
-                    "plan",
-                    plan,
-                    style="form",
-                    explode=True,
-                ),
+                name: format_argument_value(name, value)
+                for name, format_argument_value, value in (
+                    ("plan", _format_form_explode, plan),
+                )
+                if value is not None
             },
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.HarvestRunsGetResponse,
             )
@@ -1094,7 +919,7 @@ class Client(oapi.client.Client):
             json=harvest_runs_post_request_body_content_application_json_schema,  # noqa: E501
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.HarvestRunsPostResponse,
             )
@@ -1111,7 +936,7 @@ class Client(oapi.client.Client):
             method="GET",
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 sob.Dictionary,
             )
@@ -1129,18 +954,14 @@ class Client(oapi.client.Client):
                 dataset."
         """
         response: sob.abc.Readable = self.request(
-            "/metastore/schemas/{schema_id}".format(**{
-                "schema_id": str(oapi.client.format_argument_value(
-                    "schema_id",
-                    schema_id,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/metastore/schemas/"
+                f"{schema_id}"
+            ),
             method="GET",
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 sob.Dictionary,
             )
@@ -1166,26 +987,22 @@ class Client(oapi.client.Client):
                 to show the identifiers generated by DKAN.
         """
         response: sob.abc.Readable = self.request(
-            "/metastore/schemas/{schema_id}/items".format(**{
-                "schema_id": str(oapi.client.format_argument_value(
-                    "schema_id",
-                    schema_id,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/metastore/schemas/"
+                f"{schema_id}"
+                "/items"
+            ),
             method="GET",
             query={
-                "show-reference-ids": oapi.client.format_argument_value(
-                    "show-reference-ids",
-                    show_reference_ids,
-                    style="form",
-                    explode=True,
-                ),
+                name: format_argument_value(name, value)
+                for name, format_argument_value, value in (
+                    ("show-reference-ids", _format_form_explode, show_reference_ids),  # noqa: E501
+                )
+                if value is not None
             },
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.MetastoreSchemasSchemaIdItemsGetResponse,
             )
@@ -1205,24 +1022,17 @@ class Client(oapi.client.Client):
             identifier: A dataset identifier
         """
         response: sob.abc.Readable = self.request(
-            "/metastore/schemas/{schema_id}/items/{identifier}/revisions".format(**{  # noqa: E501
-                "schema_id": str(oapi.client.format_argument_value(
-                    "schema_id",
-                    schema_id,
-                    style="simple",
-                    explode=False,
-                )),
-                "identifier": str(oapi.client.format_argument_value(
-                    "identifier",
-                    identifier,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/metastore/schemas/"
+                f"{schema_id}"
+                "/items/"
+                f"{identifier}"
+                "/revisions"
+            ),
             method="GET",
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.MetastoreSchemasSchemaIdItemsIdentifierRevisionsGetResponse,  # noqa: E501
             )
@@ -1246,25 +1056,18 @@ class Client(oapi.client.Client):
             identifier: A dataset identifier
         """  # noqa: E501
         response: sob.abc.Readable = self.request(
-            "/metastore/schemas/{schema_id}/items/{identifier}/revisions".format(**{  # noqa: E501
-                "schema_id": str(oapi.client.format_argument_value(
-                    "schema_id",
-                    schema_id,
-                    style="simple",
-                    explode=False,
-                )),
-                "identifier": str(oapi.client.format_argument_value(
-                    "identifier",
-                    identifier,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/metastore/schemas/"
+                f"{schema_id}"
+                "/items/"
+                f"{identifier}"
+                "/revisions"
+            ),
             method="POST",
             json=metastore_schemas_schema_id_items_identifier_revisions_post_request_body_content_application_json_schema,  # noqa: E501
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.MetastoreWriteResponse,
             )
@@ -1287,30 +1090,18 @@ class Client(oapi.client.Client):
                 from revision object.
         """
         response: sob.abc.Readable = self.request(
-            "/metastore/schemas/{schema_id}/items/{identifier}/revisions/{revision_id}".format(**{  # noqa: E501
-                "schema_id": str(oapi.client.format_argument_value(
-                    "schema_id",
-                    schema_id,
-                    style="simple",
-                    explode=False,
-                )),
-                "identifier": str(oapi.client.format_argument_value(
-                    "identifier",
-                    identifier,
-                    style="simple",
-                    explode=False,
-                )),
-                "revision_id": str(oapi.client.format_argument_value(
-                    "revision_id",
-                    revision_id,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/metastore/schemas/"
+                f"{schema_id}"
+                "/items/"
+                f"{identifier}"
+                "/revisions/"
+                f"{revision_id}"
+            ),
             method="GET",
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.MetastoreRevision,
             )
@@ -1336,16 +1127,15 @@ class Client(oapi.client.Client):
             "/metastore/schemas/dataset/items",
             method="GET",
             query={
-                "show-reference-ids": oapi.client.format_argument_value(
-                    "show-reference-ids",
-                    show_reference_ids,
-                    style="form",
-                    explode=True,
-                ),
+                name: format_argument_value(name, value)
+                for name, format_argument_value, value in (
+                    ("show-reference-ids", _format_form_explode, show_reference_ids),  # noqa: E501
+                )
+                if value is not None
             },
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.Datasets,
             )
@@ -1373,19 +1163,12 @@ class Client(oapi.client.Client):
             identifier: A dataset identifier
         """
         response: sob.abc.Readable = self.request(
-            "/metastore/schemas/dataset/items".format(**{
-                "identifier": str(oapi.client.format_argument_value(
-                    "identifier",
-                    identifier,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            "/metastore/schemas/dataset/items",
             method="PUT",
             json=dataset,
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.MetastoreWriteResponse,
             )
@@ -1413,19 +1196,12 @@ class Client(oapi.client.Client):
             identifier: A dataset identifier
         """  # noqa: E501
         response: sob.abc.Readable = self.request(
-            "/metastore/schemas/dataset/items".format(**{
-                "identifier": str(oapi.client.format_argument_value(
-                    "identifier",
-                    identifier,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            "/metastore/schemas/dataset/items",
             method="PATCH",
             json=metastore_schemas_dataset_items_patch_request_body_content_application_json_schema,  # noqa: E501
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.MetastoreWriteResponse,
             )
@@ -1450,26 +1226,21 @@ class Client(oapi.client.Client):
                 to show the identifiers generated by DKAN.
         """
         response: sob.abc.Readable = self.request(
-            "/metastore/schemas/dataset/items/{identifier}".format(**{
-                "identifier": str(oapi.client.format_argument_value(
-                    "identifier",
-                    identifier,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/metastore/schemas/dataset/items/"
+                f"{identifier}"
+            ),
             method="GET",
             query={
-                "show-reference-ids": oapi.client.format_argument_value(
-                    "show-reference-ids",
-                    show_reference_ids,
-                    style="form",
-                    explode=True,
-                ),
+                name: format_argument_value(name, value)
+                for name, format_argument_value, value in (
+                    ("show-reference-ids", _format_form_explode, show_reference_ids),  # noqa: E501
+                )
+                if value is not None
             },
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.Dataset,
             )
@@ -1497,19 +1268,15 @@ class Client(oapi.client.Client):
             identifier: A dataset identifier
         """
         response: sob.abc.Readable = self.request(
-            "/metastore/schemas/dataset/items/{identifier}".format(**{
-                "identifier": str(oapi.client.format_argument_value(
-                    "identifier",
-                    identifier,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/metastore/schemas/dataset/items/"
+                f"{identifier}"
+            ),
             method="PUT",
             json=dataset,
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.MetastoreWriteResponse,
             )
@@ -1537,19 +1304,15 @@ class Client(oapi.client.Client):
             identifier: A dataset identifier
         """  # noqa: E501
         response: sob.abc.Readable = self.request(
-            "/metastore/schemas/dataset/items/{identifier}".format(**{
-                "identifier": str(oapi.client.format_argument_value(
-                    "identifier",
-                    identifier,
-                    style="simple",
-                    explode=False,
-                )),
-            }),
+            (
+                "/metastore/schemas/dataset/items/"
+                f"{identifier}"
+            ),
             method="PATCH",
             json=metastore_schemas_dataset_items_identifier_patch_request_body_content_application_json_schema,  # noqa: E501
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.MetastoreWriteResponse,
             )
@@ -1599,58 +1362,22 @@ class Client(oapi.client.Client):
             "/search",
             method="GET",
             query={
-                "fulltext": oapi.client.format_argument_value(
-                    "fulltext",
-                    fulltext,
-                    style="form",
-                    explode=True,
-                ),
-                "page": oapi.client.format_argument_value(
-                    "page",
-                    page,
-                    style="form",
-                    explode=True,
-                ),
-                "page-size": oapi.client.format_argument_value(
-                    "page-size",
-                    page_size,
-                    style="form",
-                    explode=True,
-                ),
-                "sort": oapi.client.format_argument_value(
-                    "sort",
-                    sort,
-                    style="form",
-                    explode=False,
-                ),
-                "sort-order": oapi.client.format_argument_value(
-                    "sort-order",
-                    sort_order,
-                    style="form",
-                    explode=False,
-                ),
-                "facets": oapi.client.format_argument_value(
-                    "facets",
-                    facets,
-                    style="form",
-                    explode=False,
-                ),
-                "theme": oapi.client.format_argument_value(
-                    "theme",
-                    theme,
-                    style="form",
-                    explode=True,
-                ),
-                "keyword": oapi.client.format_argument_value(
-                    "keyword",
-                    keyword,
-                    style="form",
-                    explode=True,
-                ),
+                name: format_argument_value(name, value)
+                for name, format_argument_value, value in (
+                    ("fulltext", _format_form_explode, fulltext),
+                    ("page", _format_form_explode, page),
+                    ("page-size", _format_form_explode, page_size),
+                    ("sort", _format_form, sort),
+                    ("sort-order", _format_form, sort_order),
+                    ("facets", _format_form, facets),
+                    ("theme", _format_form_explode, theme),
+                    ("keyword", _format_form_explode, keyword),
+                )
+                if value is not None
             },
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.SearchGetResponse,
             )
@@ -1667,7 +1394,7 @@ class Client(oapi.client.Client):
             method="GET",
         )
         return sob.unmarshal(  # type: ignore
-            sob.deserialize(response),
+            self._deserialize(response),
             types=(
                 model.SearchFacetsGetResponse,
             )
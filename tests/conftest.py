@@ -1,8 +1,37 @@
+from __future__ import annotations
+
+import os
+import threading
+import typing
+
 import pytest
 
 from cms_gov_provider_data_sdk.client import Client
+from tests.local_server import LocalServer
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 @pytest.fixture(name="client", autouse=True, scope="session")
 def get_client() -> Client:
-    return Client(echo=False)
+    return Client(echo=os.environ.get("CMS_SDK_ECHO") == "1")
+
+
+@pytest.fixture(name="server")
+def get_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[LocalServer]:
+    server: LocalServer = LocalServer()
+    thread: threading.Thread = threading.Thread(
+        target=server.serve_forever,
+        kwargs={"poll_interval": 0.01},
+        daemon=True,
+    )
+    thread.start()
+    monkeypatch.setenv(
+        "http_proxy", "http://{}:{}".format(*server.server_address)
+    )
+    monkeypatch.delenv("no_proxy", raising=False)
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    yield server
+    server.shutdown()
+    server.server_close()
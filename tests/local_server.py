@@ -0,0 +1,116 @@
+"""
+A local HTTP server, used (as an HTTP proxy) to test clients without
+sending requests to the CMS Provider Data API.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import typing
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# `oapi` rejects URLs with a port, so requests are sent to this (reserved,
+# unresolvable) host, through the local server acting as an HTTP proxy
+URL: str = "http://cms.test/provider-data/api/1"
+
+Response = tuple[int, dict[str, str], bytes]
+
+# This is large enough, and random enough, that its gzip-encoded content
+# is larger than `cms_gov_provider_data_sdk._base.GZIP_READ_SIZE`
+JSON_BODY: bytes = json.dumps(
+    {
+        "results": [
+            {"row": str(index), "hash": sha256(b"%d" % index).hexdigest()}
+            for index in range(5000)
+        ]
+    }
+).encode()
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: LocalServer
+
+    def log_message(self, *args: typing.Any) -> None:
+        pass
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.respond()
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.respond()
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self.respond()
+
+    def respond(self) -> None:
+        self.server.connections.add(self.client_address)
+        body: bytes = self.rfile.read(
+            int(self.headers.get("Content-Length", 0))
+        )
+        self.request_body: bytes = body
+        self.server.requests.append(
+            (self.command, self.path, self.headers, body)
+        )
+        status: int
+        headers: dict[str, str]
+        status, headers, body = self.server.respond(self)
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        if headers.get("Transfer-Encoding") == "chunked":
+            self.end_headers()
+            for index in range(0, len(body), 1000):
+                chunk: bytes = body[index : index + 1000]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            # The response to a HEAD request has the headers, but not the
+            # body, of the response to a GET request
+            if self.command != "HEAD":
+                self.wfile.write(body)
+        self.close_connection = self.server.close_connections
+
+
+class LocalServer(ThreadingHTTPServer):
+    """
+    A local HTTP server, which records the requests it receives and the
+    connections they are received on, and responds using `respond`.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), RequestHandler)
+        self.connections: set[tuple[str, int]] = set()
+        # The method, URL, headers and body of each request
+        self.requests: list[tuple[str, str, typing.Any, bytes]] = []
+        # If `True`, connections are closed after each response, without
+        # the server indicating this in its response headers
+        self.close_connections: bool = False
+        self.respond: typing.Callable[[RequestHandler], Response] = (
+            respond_json
+        )
+
+
+def respond_json(
+    handler: RequestHandler,
+    body: bytes = JSON_BODY,
+    *,
+    status: int = 200,
+    transfer_encoding: str = "",
+) -> Response:
+    """
+    Respond with a JSON `body`, gzip-encoded if the request accepts it.
+    """
+    headers: dict[str, str] = {"Content-Type": "application/json"}
+    if transfer_encoding:
+        headers["Transfer-Encoding"] = transfer_encoding
+    if handler.headers.get("Accept-Encoding") == "gzip":
+        headers["Content-Encoding"] = "gzip"
+        body = gzip.compress(body)
+    return status, headers, body
@@ -0,0 +1,821 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import pickle
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from hashlib import sha256
+from io import BufferedReader, BytesIO
+from json import JSONDecoder
+from urllib.error import HTTPError, URLError
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import sob
+
+from cms_gov_provider_data_sdk import model
+from cms_gov_provider_data_sdk._base import (
+    _iter_json_array_items,  # noqa: PLC2701
+)
+from cms_gov_provider_data_sdk.async_client import AsyncClient
+from cms_gov_provider_data_sdk.client import Client
+from tests.local_server import (
+    JSON_BODY,
+    URL,
+    LocalServer,
+    RequestHandler,
+    Response,
+    respond_json,
+)
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def respond_count(handler: RequestHandler) -> Response:
+    """
+    Respond to a datastore query with a count equal to the (numeric)
+    distribution ID.
+    """
+    distribution_id: str = urlsplit(handler.path).path.rpartition("/")[-1]
+    return respond_json(
+        handler, json.dumps({"count": int(distribution_id)}).encode()
+    )
+
+
+def respond_cacheable(
+    handler: RequestHandler, cache_control: str = "no-cache"
+) -> Response:
+    """
+    Respond with a JSON body and `ETag`, or with HTTP 304 (NOT MODIFIED) if
+    the request's `If-None-Match` header matches the `ETag`.
+    """
+    headers: dict[str, str] = {"ETag": '"v1"', "Cache-Control": cache_control}
+    if handler.headers.get("If-None-Match") == '"v1"':
+        return 304, headers, b""
+    status: int
+    body: bytes
+    status, response_headers, body = respond_json(handler)
+    return status, {**response_headers, **headers}, body
+
+
+def respond_token(handler: RequestHandler, expires_in: int = 3600) -> Response:
+    """
+    Respond to an OAuth2 token request with an access token numbered
+    according to how many tokens have been issued, or otherwise with a JSON
+    body.
+    """
+    if urlsplit(handler.path).path != "/token":
+        return respond_json(handler)
+    # This ensures concurrent requests for a token would overlap
+    time.sleep(0.1)
+    number: int = sum(
+        urlsplit(path).path == "/token"
+        for _, path, _, _ in handler.server.requests
+    )
+    return respond_json(
+        handler,
+        json.dumps(
+            {
+                "access_token": f"token-{number}",
+                "token_type": "Bearer",
+                "expires_in": expires_in,
+            }
+        ).encode(),
+    )
+
+
+def respond_search(handler: RequestHandler) -> Response:
+    """
+    Respond to a search with a total equal to the requested page number,
+    after a delay which varies by page (so that concurrent requests complete
+    out of order), or with HTTP 404 (NOT FOUND) for pages after page 99.
+    """
+    page: int = int(parse_qs(urlsplit(handler.path).query)["page"][0])
+    if page > 99:  # noqa: PLR2004
+        return respond_json(handler, b"{}", status=404)
+    time.sleep(0.002 * (page * 7 % 5))
+    return respond_json(
+        handler, json.dumps({"total": page, "results": {}}).encode()
+    )
+
+
+def respond_dataset(handler: RequestHandler) -> Response:
+    """
+    Respond with a dataset with the requested identifier, after a delay
+    which varies by identifier, or with HTTP 404 (NOT FOUND) for the
+    identifier "missing".
+    """
+    identifier: str = urlsplit(handler.path).path.rpartition("/")[-1]
+    if identifier == "missing":
+        return respond_json(handler, b"{}", status=404)
+    time.sleep(0.002 * (sum(identifier.encode()) % 5))
+    return respond_json(
+        handler,
+        json.dumps({"identifier": identifier, "title": identifier}).encode(),
+    )
+
+
+def respond_datastore_query(handler: RequestHandler) -> Response:
+    """
+    Respond to a datastore query with a count equal to the query's `limit`,
+    after a delay which varies by limit, or with HTTP 404 (NOT FOUND) if the
+    query has no limit.
+    """
+    limit: int | None = json.loads(handler.request_body).get("limit")
+    if limit is None:
+        return respond_json(handler, b"{}", status=404)
+    time.sleep(0.002 * (limit * 7 % 5))
+    return respond_json(handler, json.dumps({"count": limit}).encode())
+
+
+# A CSV document which is not valid JSON, and is encoded with multi-byte
+# (UTF-8) characters
+CSV_BODY: bytes = "name,city\r\nCaf\u00e9 Hospital,San Jos\u00e9\r\n".encode()
+
+
+def respond_csv(handler: RequestHandler) -> Response:
+    """
+    Respond with a CSV body, gzip-encoded if the request accepts it.
+    """
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    status, headers, body = respond_json(handler, CSV_BODY)
+    return status, {**headers, "Content-Type": "text/csv"}, body
+
+
+@pytest.fixture(name="local_client")
+def get_local_client(server: LocalServer) -> Iterator[Client]:
+    # Requests are not retried, so that connection errors are only handled
+    # by the connection pool
+    with Client(url=URL, retry_number_of_attempts=1) as local_client:
+        yield local_client
+
+
+def test_connection_reuse(server: LocalServer, local_client: Client) -> None:
+    """
+    Test that connections are kept alive, and re-used for subsequent
+    requests, including requests sent concurrently.
+    """
+    for _ in range(5):
+        assert local_client.request("/a", "GET").read() == JSON_BODY
+    assert len(server.connections) == 1
+
+    def read(path: str) -> bytes:
+        return local_client.request(path, "GET").read()  # type: ignore
+
+    executor: ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert set(executor.map(read, ["/b"] * 20)) == {JSON_BODY}
+    assert len(server.connections) <= 5  # noqa: PLR2004
+
+
+def test_connection_release(server: LocalServer, local_client: Client) -> None:
+    """
+    Test that a connection is not re-used if its response is closed before
+    being read in full, and that closing a client closes its idle
+    connections.
+    """
+    with local_client.request("/a", "GET") as response:
+        response.read(10)
+    assert local_client.request("/a", "GET").read() == JSON_BODY
+    assert len(server.connections) == 2  # noqa: PLR2004
+    local_client.close()
+    assert local_client.request("/a", "GET").read() == JSON_BODY
+    assert len(server.connections) == 3  # noqa: PLR2004
+
+
+def test_stale_connection_retry(
+    server: LocalServer, local_client: Client
+) -> None:
+    """
+    Test that a request sent on an idle connection which has been closed by
+    the server is sent again, on a new connection.
+    """
+    server.close_connections = True
+    for _ in range(3):
+        assert local_client.request("/a", "GET").read() == JSON_BODY
+    assert len(server.connections) == 3  # noqa: PLR2004
+
+
+def test_stale_connection_no_retry(
+    server: LocalServer, local_client: Client
+) -> None:
+    """
+    Test that a non-idempotent (`POST`) request sent on an idle connection
+    which has been closed by the server is not sent again.
+    """
+    server.close_connections = True
+    assert local_client.request("/a", "POST", json="{}").read() == JSON_BODY
+    with pytest.raises((URLError, ConnectionError)):
+        local_client.request("/a", "POST", json="{}")
+    assert [request[0] for request in server.requests] == ["POST"]
+
+
+def test_async_client_close(server: LocalServer) -> None:
+    """
+    Test that an asynchronous client's connections and worker threads are
+    released when used as an asynchronous context manager.
+    """
+
+    async def read() -> bytes:
+        async_client: AsyncClient
+        async with AsyncClient(
+            url=URL, retry_number_of_attempts=1
+        ) as async_client:
+            response: typing.Any = await async_client.request("/a", "GET")
+            assert async_client._executor is not None  # noqa: SLF001
+        assert async_client._executor is None  # noqa: SLF001
+        assert async_client._pooled_opener is None  # noqa: SLF001
+        return response.read()  # type: ignore
+
+    assert asyncio.run(read()) == JSON_BODY
+    assert len(server.requests) == 1
+
+
+def test_csv_download(server: LocalServer, local_client: Client) -> None:
+    """
+    Test that operations which only respond with CSV return the decoded
+    response body, rather than attempting to parse it as JSON.
+    """
+    server.respond = respond_csv
+    csv_text: str = CSV_BODY.decode()
+    assert local_client.get_datastore_query_download(format="csv") == csv_text
+    assert (
+        local_client.post_datastore_query_download(
+            model.DatastoreQuery(limit=1)
+        )
+        == csv_text
+    )
+    assert (
+        local_client.get_datastore_query_distribution_id__download(
+            "distribution-id", format="csv"
+        )
+        == csv_text
+    )
+    async_client: AsyncClient
+    with AsyncClient(url=URL, retry_number_of_attempts=1) as async_client:
+        assert (
+            asyncio.run(
+                async_client.get_datastore_query_distribution_id__download(
+                    "distribution-id", format="csv"
+                )
+            )
+            == csv_text
+        )
+
+
+def test_request_body_serialization(
+    server: LocalServer, local_client: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that request bodies are identical whether or not `orjson` is
+    installed.
+    """
+    pytest.importorskip("orjson")
+    server.respond = respond_datastore_query
+    datastore_query: model.DatastoreQuery = model.DatastoreQuery(
+        conditions=model.DatastoreQueryConditions(
+            [
+                model.DatastoreQueryCondition(
+                    property_="city",
+                    value="San Jos\u00e9 \u2028",
+                    operator="=",
+                )
+            ]
+        ),
+        limit=10,
+        offset=2,
+        results=False,
+    )
+    local_client.post_datastore_query(datastore_query)
+    monkeypatch.setattr("cms_gov_provider_data_sdk._base.orjson", None)
+    local_client.post_datastore_query(datastore_query)
+    bodies: list[bytes] = [body for _, _, _, body in server.requests]
+    assert bodies[0] == bodies[1]
+    assert json.loads(bodies[0]) == sob.marshal(datastore_query)
+
+
+def test_map_datastore_query_distributions(
+    server: LocalServer, local_client: Client
+) -> None:
+    """
+    Test that distributions queried concurrently are returned in order.
+    """
+    server.respond = respond_count
+    distribution_ids: list[str] = list(map(str, range(20)))
+    assert [
+        response.count  # type: ignore
+        for response in local_client.map_datastore_query_distributions(
+            distribution_ids, max_workers=4
+        )
+    ] == list(range(20))
+    async_client: AsyncClient
+    with AsyncClient(url=URL, retry_number_of_attempts=1) as async_client:
+        assert [
+            response.count  # type: ignore
+            for response in asyncio.run(
+                async_client.map_datastore_query_distributions(
+                    distribution_ids, max_workers=4
+                )
+            )
+        ] == list(range(20))
+
+
+def test_map_search_pages(server: LocalServer, local_client: Client) -> None:
+    """
+    Test that search pages requested concurrently are returned in order,
+    and that an error for any page is raised.
+    """
+    server.respond = respond_search
+    pages: list[int] = list(range(1, 21))
+    assert [
+        response.total
+        for response in local_client.map_search_pages(
+            pages, max_workers=4, page_size=5
+        )
+    ] == pages
+    assert all(
+        parse_qs(urlsplit(path).query)["page-size"] == ["5"]
+        for _, path, _, _ in server.requests
+    )
+    with pytest.raises(HTTPError):
+        local_client.map_search_pages([1, 100, 2], max_workers=4)
+    async_client: AsyncClient
+    with AsyncClient(url=URL, retry_number_of_attempts=1) as async_client:
+        assert [
+            response.total  # type: ignore
+            for response in asyncio.run(
+                async_client.map_search_pages(pages, max_workers=4)
+            )
+        ] == pages
+        with pytest.raises(HTTPError):
+            asyncio.run(
+                async_client.map_search_pages([1, 100, 2], max_workers=4)
+            )
+
+
+def test_map_metastore_schemas_dataset_items_identifiers(
+    server: LocalServer, local_client: Client
+) -> None:
+    """
+    Test that datasets requested concurrently are returned in order, and
+    that an error for any dataset is raised.
+    """
+    server.respond = respond_dataset
+    identifiers: list[str] = [f"dataset-{index}" for index in range(20)]
+    assert [
+        dataset.identifier
+        for dataset in (
+            local_client.map_metastore_schemas_dataset_items_identifiers(
+                identifiers, max_workers=4, show_reference_ids=True
+            )
+        )
+    ] == identifiers
+    assert all(
+        parse_qs(urlsplit(path).query)["show-reference-ids"] == ["true"]
+        for _, path, _, _ in server.requests
+    )
+    with pytest.raises(HTTPError):
+        local_client.map_metastore_schemas_dataset_items_identifiers(
+            ["dataset-1", "missing"], max_workers=4
+        )
+    async_client: AsyncClient
+    with AsyncClient(url=URL, retry_number_of_attempts=1) as async_client:
+        assert [
+            dataset.identifier  # type: ignore
+            for dataset in asyncio.run(
+                async_client.map_metastore_schemas_dataset_items_identifiers(
+                    identifiers, max_workers=4
+                )
+            )
+        ] == identifiers
+        with pytest.raises(HTTPError):
+            asyncio.run(
+                async_client.map_metastore_schemas_dataset_items_identifiers(
+                    ["dataset-1", "missing"], max_workers=4
+                )
+            )
+
+
+def test_post_datastore_queries(
+    server: LocalServer, local_client: Client
+) -> None:
+    """
+    Test that datastore queries sent concurrently are returned in order,
+    and that an error for any query is raised.
+    """
+    server.respond = respond_datastore_query
+    limits: list[int] = list(range(1, 21))
+    queries: list[model.DatastoreQuery] = [
+        model.DatastoreQuery(limit=limit) for limit in limits
+    ]
+    assert [
+        response.count  # type: ignore
+        for response in local_client.post_datastore_queries(
+            queries, max_workers=4
+        )
+    ] == limits
+    assert {method for method, _, _, _ in server.requests} == {"POST"}
+    with pytest.raises(HTTPError):
+        local_client.post_datastore_queries(
+            [queries[0], model.DatastoreQuery()], max_workers=4
+        )
+    async_client: AsyncClient
+    with AsyncClient(url=URL, retry_number_of_attempts=1) as async_client:
+        assert [
+            response.count  # type: ignore
+            for response in asyncio.run(
+                async_client.post_datastore_queries(queries, max_workers=4)
+            )
+        ] == limits
+        with pytest.raises(HTTPError):
+            asyncio.run(
+                async_client.post_datastore_queries(
+                    [queries[0], model.DatastoreQuery()], max_workers=4
+                )
+            )
+
+
+def test_count_datastore_query_distribution(
+    server: LocalServer, local_client: Client
+) -> None:
+    """
+    Test that only a count is requested when counting rows.
+    """
+    server.respond = respond_count
+    assert local_client.count_datastore_query_distribution("3") == 3  # noqa: PLR2004
+    method, url, _, body = server.requests[-1]
+    assert method == "GET"
+    assert parse_qs(urlsplit(url).query) == {
+        "count": ["true"],
+        "results": ["false"],
+        "schema": ["false"],
+    }
+    datastore_resource_query: model.DatastoreResourceQuery = (
+        model.DatastoreResourceQuery(limit=10)
+    )
+    assert (
+        local_client.count_datastore_query_distribution(
+            "4", datastore_resource_query
+        )
+        == 4  # noqa: PLR2004
+    )
+    method, url, _, body = server.requests[-1]
+    assert method == "POST"
+    assert json.loads(body) == {
+        "limit": 10,
+        "count": True,
+        "results": False,
+        "schema": False,
+        "format": "json",
+    }
+    # The query provided is not modified
+    assert datastore_resource_query.count is None
+
+
+@pytest.mark.parametrize("transfer_encoding", ["", "chunked"])
+def test_gzip_read(
+    server: LocalServer, local_client: Client, transfer_encoding: str
+) -> None:
+    """
+    Test that gzip-encoded responses are requested, and decoded whether
+    read in full, in chunks, or after a partial read.
+    """
+    server.respond = partial(respond_json, transfer_encoding=transfer_encoding)
+    assert local_client.request("/a", "GET").read() == JSON_BODY
+    assert server.requests[-1][2]["Accept-Encoding"] == "gzip"
+    with local_client.request("/a", "GET") as response:
+        assert (
+            b"".join(iter(partial(response.read, 777), b""))  # type: ignore
+            == JSON_BODY
+        )
+    with local_client.request("/a", "GET") as response:
+        buffer: bytearray = bytearray(100)
+        assert response.readinto(buffer) == len(buffer)  # type: ignore
+        assert bytes(buffer) + response.read() == JSON_BODY  # type: ignore
+    with local_client.request("/a", "GET") as response:
+        assert BufferedReader(response).read() == JSON_BODY  # type: ignore
+
+
+def test_gzip_echo(
+    server: LocalServer, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """
+    Test that gzip-encoded responses are echoed with their decoded body.
+    """
+    with Client(url=URL, echo=True) as echo_client:
+        assert echo_client.request("/a", "GET").read() == JSON_BODY
+    assert '{"row": "4999", ' in capsys.readouterr().out
+
+
+def test_gzip_error(server: LocalServer, local_client: Client) -> None:
+    """
+    Test that the body of a gzip-encoded error response is decoded.
+    """
+    server.respond = partial(
+        respond_json, body=b'{"message": "Not found"}', status=404
+    )
+    with pytest.raises(HTTPError) as exception_info:
+        local_client.request("/a", "GET")
+    assert "Content-Encoding" not in exception_info.value.headers
+    assert '{"message": "Not found"}' in str(exception_info.value)
+
+
+def test_response_cache(server: LocalServer) -> None:
+    """
+    Test that fresh responses are served from the cache, that stale
+    responses are revalidated, and that `no-store` responses are not
+    cached.
+    """
+    cache_control: str
+    expected_requests: int
+    for cache_control, expected_requests in (
+        ("max-age=60", 1),
+        ("no-cache", 3),
+        ("no-store", 3),
+    ):
+        server.requests.clear()
+        server.respond = partial(
+            respond_cacheable, cache_control=cache_control
+        )
+        cache_client: Client
+        with Client(url=URL, response_cache_ttl=60) as cache_client:
+            for _ in range(3):
+                assert cache_client.request("/a", "GET").read() == JSON_BODY
+        assert len(server.requests) == expected_requests
+        if cache_control == "no-cache":
+            assert server.requests[1][2]["If-None-Match"] == '"v1"'
+        else:
+            assert "If-None-Match" not in server.requests[-1][2]
+
+
+def test_request_if_modified(server: LocalServer) -> None:
+    """
+    Test that a conditional request returns `None` (without being retried)
+    if the resource is not modified, and releases the connection.
+    """
+    server.respond = respond_cacheable
+    client: Client
+    with Client(url=URL, retry_number_of_attempts=3) as client:
+        response: typing.Any = client.request_if_modified("/a")
+        assert response is not None
+        with response:
+            assert response.read() == JSON_BODY
+            etag: str = response.headers["ETag"]
+        assert client.request_if_modified("/a", etag=etag) is None
+        assert client.request_if_modified("/a", etag=etag) is None
+    assert len(server.requests) == 3  # noqa: PLR2004
+    assert len(server.connections) == 1
+    assert server.requests[-1][2]["If-None-Match"] == etag
+
+    async def request_if_modified() -> tuple[bytes, str, bool]:
+        async_client: AsyncClient
+        async with AsyncClient(
+            url=URL, retry_number_of_attempts=3
+        ) as async_client:
+            response: typing.Any = await async_client.request_if_modified("/a")
+            return (
+                response.read(),
+                response.headers["ETag"],
+                await async_client.request_if_modified("/a", etag=etag)
+                is None,
+            )
+
+    assert asyncio.run(request_if_modified()) == (JSON_BODY, etag, True)
+
+
+def get_oauth2_client() -> Client:
+    return Client(
+        url=URL,
+        retry_number_of_attempts=1,
+        oauth2_client_id="client-id",
+        oauth2_client_secret="client-secret",
+        oauth2_token_url="http://cms.test/token",
+    )
+
+
+def test_oauth2_concurrent_authorization(server: LocalServer) -> None:
+    """
+    Test that only one access token is requested when requests are sent
+    concurrently, and that every request is sent with it.
+    """
+    server.respond = respond_token
+    barrier: threading.Barrier = threading.Barrier(8)
+    client: Client
+
+    def read(path: str) -> bytes:
+        barrier.wait()
+        return client.request(path, "GET").read()  # type: ignore
+
+    with get_oauth2_client() as client:
+        executor: ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert set(executor.map(read, ["/a"] * 8)) == {JSON_BODY}
+    assert [path for _, path, _, _ in server.requests].count(
+        "http://cms.test/token"
+    ) == 1
+    assert {
+        headers["Authorization"]
+        for _, path, headers, _ in server.requests
+        if path != "http://cms.test/token"
+    } == {"Bearer token-1"}
+
+
+@pytest.mark.parametrize(
+    ("expires_in", "refresh_after"),
+    # `oapi` treats tokens as expiring one second early, and a token is
+    # then refreshed 5 minutes before its expiration, or half-way through
+    # its lifetime if shorter
+    [(3600, 3299), (100, 50)],
+)
+def test_oauth2_authorization_refresh(
+    server: LocalServer,
+    monkeypatch: pytest.MonkeyPatch,
+    expires_in: int,
+    refresh_after: int,
+) -> None:
+    """
+    Test that an access token is refreshed ahead of its expiration.
+    """
+    server.respond = partial(respond_token, expires_in=expires_in)
+    now: int = 1_700_000_000
+    monkeypatch.setattr("time.time", lambda: now)
+    client: Client
+    with get_oauth2_client() as client:
+        client.request("/a", "GET").read()
+        assert client._oauth2_authorization_expires == now + refresh_after  # noqa: SLF001
+        now += refresh_after
+        client.request("/a", "GET").read()
+        now += 1
+        client.request("/a", "GET").read()
+    assert [
+        headers["Authorization"]
+        for _, path, headers, _ in server.requests
+        if path != "http://cms.test/token"
+    ] == ["Bearer token-1", "Bearer token-1", "Bearer token-2"]
+
+
+def test_pickle(server: LocalServer) -> None:
+    """
+    Test that clients which have been used can be pickled, and that their
+    connections, worker threads, lock and cached responses are not.
+    """
+    server.respond = respond_cacheable
+    client: Client = Client(
+        url=URL, retry_number_of_attempts=1, response_cache_ttl=60
+    )
+    assert client.request("/a", "GET").read() == JSON_BODY
+    unpickled: Client = pickle.loads(pickle.dumps(client))  # noqa: S301
+    assert unpickled.url == URL
+    assert unpickled.retry_number_of_attempts == 1
+    assert unpickled.response_cache_ttl == 60  # noqa: PLR2004
+    assert unpickled._pooled_opener is None  # noqa: SLF001
+    assert not unpickled._response_cache._responses  # noqa: SLF001
+    assert (
+        unpickled._oauth2_authorization_lock  # noqa: SLF001
+        is not client._oauth2_authorization_lock  # noqa: SLF001
+    )
+    assert unpickled.request("/a", "GET").read() == JSON_BODY
+    unpickled.close()
+    client.close()
+
+    async def read(async_client: AsyncClient) -> bytes:
+        async with async_client:
+            return (await async_client.request("/a", "GET")).read()  # type: ignore
+
+    async_client: AsyncClient = AsyncClient(
+        url=URL, retry_number_of_attempts=1
+    )
+    asyncio.run(async_client.request("/a", "GET"))
+    assert async_client._executor is not None  # noqa: SLF001
+    unpickled_async: AsyncClient = pickle.loads(pickle.dumps(async_client))  # noqa: S301
+    async_client.close()
+    assert unpickled_async._executor is None  # noqa: SLF001
+    assert unpickled_async._pooled_opener is None  # noqa: SLF001
+    assert asyncio.run(read(unpickled_async)) == JSON_BODY
+    assert len(server.requests) == 4  # noqa: PLR2004
+
+
+class _ChunkedIO(BytesIO):
+    """
+    A stream from which at most `size` bytes are read at a time.
+    """
+
+    def __init__(self, data: bytes, size: int) -> None:
+        super().__init__(data)
+        self._size: int = size
+
+    def read(self, size: int | None = -1) -> bytes:
+        return super().read(self._size)
+
+
+def iter_chunked_json_array_items(
+    data: bytes, size: int
+) -> Iterator[typing.Any]:
+    return _iter_json_array_items(_ChunkedIO(data, size))  # type: ignore
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 64])
+def test_iter_json_array_items(size: int) -> None:
+    """
+    Test that JSON array items (including numbers, and multi-byte UTF-8
+    characters) are parsed correctly when split across reads.
+    """
+    items: list[typing.Any] = [
+        1234567,
+        -0.5e10,
+        1.5e-7,
+        "caf\u00e9 \u2713",
+        'a "quoted" [string] {with} \\ escapes',
+        {"a": [1, 2, {"b": None}], "c": True},
+        [],
+        False,
+        98765,
+    ]
+    data: bytes = json.dumps(items, ensure_ascii=False, indent=1).encode()
+    assert list(iter_chunked_json_array_items(data, size)) == items
+    assert list(iter_chunked_json_array_items(b" [ ] ", size)) == []
+    with pytest.raises(ValueError, match="incomplete"):
+        list(iter_chunked_json_array_items(data[:-1], size))
+    assert list(iter_chunked_json_array_items(b"[1, 2]\n", size)) == [1, 2]
+    with pytest.raises(ValueError, match="after the JSON array"):
+        list(iter_chunked_json_array_items(b"[1, 2] [3]", size))
+
+
+def test_iter_json_array_items_decoded_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that each item is decoded once, however many reads it spans.
+    """
+    decoded: list[int] = []
+
+    class CountingDecoder(JSONDecoder):
+        def raw_decode(self, s: str, idx: int = 0) -> tuple[typing.Any, int]:
+            decoded.append(len(s) - idx)
+            return super().raw_decode(s, idx)
+
+    monkeypatch.setattr(
+        "cms_gov_provider_data_sdk._base.JSONDecoder", CountingDecoder
+    )
+    items: list[typing.Any] = [
+        [{"row": index, "text": '"[{'} for index in range(2000)],
+        "x" * 10000,
+        12345,
+    ]
+    data: bytes = json.dumps(items).encode()
+    assert list(iter_chunked_json_array_items(data, 7)) == items
+    assert len(decoded) == len(items)
+
+
+def test_iter_metastore_schemas_dataset_items(
+    server: LocalServer, local_client: Client
+) -> None:
+    """
+    Test that datasets are parsed from a gzip-encoded, chunked, response,
+    by both the synchronous and asynchronous clients.
+    """
+    datasets: list[dict[str, str]] = [
+        {
+            "identifier": f"{index:04d}",
+            "title": sha256(b"%d" % index).hexdigest(),
+        }
+        for index in range(2000)
+    ]
+    server.respond = partial(
+        respond_json,
+        body=json.dumps(datasets).encode(),
+        transfer_encoding="chunked",
+    )
+    assert [
+        dataset.identifier
+        for dataset in local_client.iter_metastore_schemas_dataset_items()
+    ] == [dataset["identifier"] for dataset in datasets]
+    # The response is read to the end, so its connection is re-used
+    assert (
+        local_client.request("/a", "GET").read()
+        == json.dumps(datasets).encode()
+    )
+    assert len(server.connections) == 1
+
+    async def get_identifiers() -> list[str]:
+        async_client: AsyncClient
+        async with AsyncClient(
+            url=URL, retry_number_of_attempts=1
+        ) as async_client:
+            return [
+                dataset.identifier  # type: ignore
+                async for dataset in (
+                    async_client.iter_metastore_schemas_dataset_items()
+                )
+            ]
+
+    assert asyncio.run(get_identifiers()) == [
+        dataset["identifier"] for dataset in datasets
+    ]
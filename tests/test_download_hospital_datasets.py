@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+import importlib
+import sys
+import typing
+from email.message import Message
+from functools import partial
+from io import BufferedReader, BytesIO
+from pathlib import Path
+
+import pytest
+
+from cms_gov_provider_data_sdk.client import Client
+from tests.local_server import URL, LocalServer, RequestHandler, Response
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import ModuleType
+
+pytest.importorskip("pyarrow")
+
+EXAMPLE_PATH: Path = Path(__file__).parent.parent / "example"
+
+DOWNLOAD_URL: str = f"{URL}/download/hospitals.csv"
+CSV_BODY: bytes = b"Facility ID,Facility Name\r\n" + b"".join(
+    b"%06d,Example Hospital %d\r\n" % (index, index) for index in range(100)
+)
+ETAG: str = '"v1"'
+
+
+def import_example() -> ModuleType:
+    sys.path.insert(0, str(EXAMPLE_PATH))
+    try:
+        return importlib.import_module("download_hospital_datasets")
+    finally:
+        sys.path.remove(str(EXAMPLE_PATH))
+
+
+download_hospital_datasets: ModuleType = import_example()
+
+
+def respond_download(
+    handler: RequestHandler,
+    body: bytes = CSV_BODY,
+    *,
+    accept_ranges: bool = False,
+    honor_ranges: bool = False,
+) -> Response:
+    """
+    Respond with a CSV download and its `ETag`, or with HTTP 304 (NOT
+    MODIFIED) if the request's `If-None-Match` header matches the `ETag`.
+
+    Parameters:
+        body: The CSV download.
+        accept_ranges: If `True`, support for byte range requests is
+            advertised (using the `Accept-Ranges` header).
+        honor_ranges: If `True`, byte range requests are honored.
+            Otherwise, the `Range` header is ignored.
+    """
+    headers: dict[str, str] = {"Content-Type": "text/csv", "ETag": ETAG}
+    if handler.headers.get("If-None-Match") == ETAG:
+        return 304, headers, b""
+    if accept_ranges:
+        headers["Accept-Ranges"] = "bytes"
+    range_: str | None = handler.headers.get("Range")
+    if range_ is None or not honor_ranges:
+        return 200, headers, body
+    start: str
+    end: str
+    start, _, end = range_.removeprefix("bytes=").partition("-")
+    headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+    return 206, headers, body[int(start) : int(end) + 1]
+
+
+@pytest.fixture(name="local_client")
+def get_local_client(server: LocalServer) -> Iterator[Client]:
+    server.respond = respond_download
+    with Client(url=URL, retry_number_of_attempts=3) as local_client:
+        yield local_client
+
+
+def test_sync_state(tmp_path: Path) -> None:
+    """
+    Test that the sync state is saved (replacing any previous state, without
+    leaving a temporary file) and loaded.
+    """
+    assert download_hospital_datasets.load_sync_state(tmp_path) == {}
+    sync_state: dict[str, dict[str, str]] = {
+        DOWNLOAD_URL: {"ETag": ETAG, "Last-Modified": "Mon, 1 Jan 2024"}
+    }
+    download_hospital_datasets.save_sync_state(tmp_path, {"a": {}})
+    download_hospital_datasets.save_sync_state(tmp_path, sync_state)
+    assert download_hospital_datasets.load_sync_state(tmp_path) == sync_state
+    assert [path.name for path in tmp_path.iterdir()] == [
+        download_hospital_datasets.SYNC_STATE_FILE_NAME
+    ]
+
+
+@pytest.mark.parametrize("data", ['{"https://', "[]", ""])
+def test_invalid_sync_state(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, data: str
+) -> None:
+    """
+    Test that an unreadable (for example, truncated) or invalid sync state
+    is ignored, with a warning, so that every dataset is downloaded.
+    """
+    (tmp_path / download_hospital_datasets.SYNC_STATE_FILE_NAME).write_text(
+        data
+    )
+    assert download_hospital_datasets.load_sync_state(tmp_path) == {}
+    assert "sync state" in caplog.text
+
+
+def test_head_download(server: LocalServer, local_client: Client) -> None:
+    """
+    Test that a download's headers are returned, unless it has not been
+    modified since its validators were obtained, in which case the HTTP 304
+    (NOT MODIFIED) response is neither retried nor left open.
+    """
+    headers: typing.Any = download_hospital_datasets.head_download(
+        DOWNLOAD_URL, local_client
+    )
+    validators: dict[str, str] = download_hospital_datasets.get_validators(
+        headers
+    )
+    assert validators == {"ETag": ETAG}
+    assert (
+        download_hospital_datasets.head_download(
+            DOWNLOAD_URL, local_client, validators
+        )
+        is None
+    )
+    assert [method for method, _, _, _ in server.requests] == ["HEAD"] * 2
+    assert server.requests[-1][2]["If-None-Match"] == ETAG
+    assert len(server.connections) == 1
+
+
+@pytest.mark.parametrize(
+    ("headers", "content_length"),
+    [
+        ({"Accept-Ranges": "bytes", "Content-Length": "123"}, 123),
+        ({"Accept-Ranges": " Bytes ", "Content-Length": "123"}, 123),
+        ({"Accept-Ranges": "none", "Content-Length": "123"}, None),
+        ({"Content-Length": "123"}, None),
+        ({"Accept-Ranges": "bytes"}, None),
+    ],
+)
+def test_get_range_content_length(
+    headers: dict[str, str], content_length: int | None
+) -> None:
+    """
+    Test that a download's size is only used if byte range requests are
+    supported.
+    """
+    message: Message = Message()
+    key: str
+    value: str
+    for key, value in headers.items():
+        message[key] = value
+    assert (
+        download_hospital_datasets.get_range_content_length(message)
+        == content_length
+    )
+
+
+@pytest.mark.parametrize("honor_ranges", [True, False])
+def test_read_range(
+    server: LocalServer, local_client: Client, *, honor_ranges: bool
+) -> None:
+    """
+    Test that a byte range is read if the server honors the range request,
+    and that `None` is returned (rather than the whole download) if the
+    server ignores it.
+    """
+    server.respond = partial(
+        respond_download, accept_ranges=True, honor_ranges=honor_ranges
+    )
+    assert download_hospital_datasets.read_range(
+        DOWNLOAD_URL, 10, 19, local_client
+    ) == (CSV_BODY[10:20] if honor_ranges else None)
+    assert server.requests[-1][2]["Range"] == "bytes=10-19"
+
+
+@pytest.mark.parametrize(
+    ("accept_ranges", "honor_ranges"),
+    [(True, True), (True, False), (False, False)],
+)
+def test_open_download(
+    server: LocalServer,
+    local_client: Client,
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    accept_ranges: bool,
+    honor_ranges: bool,
+) -> None:
+    """
+    Test that a large download is read in parallel byte ranges if the
+    server supports range requests, and is otherwise streamed in full,
+    including when the server advertises, but ignores, range requests.
+    """
+    monkeypatch.setattr(
+        download_hospital_datasets, "RANGE_DOWNLOAD_THRESHOLD", 100
+    )
+    server.respond = partial(
+        respond_download,
+        accept_ranges=accept_ranges,
+        honor_ranges=honor_ranges,
+    )
+    headers: typing.Any = download_hospital_datasets.head_download(
+        DOWNLOAD_URL, local_client
+    )
+    response: typing.IO[bytes]
+    with download_hospital_datasets.open_download(
+        DOWNLOAD_URL, headers, local_client
+    ) as response:
+        assert response.read() == CSV_BODY
+    ranges: list[str] = [
+        request_headers["Range"]
+        for _, _, request_headers, _ in server.requests
+        if "Range" in request_headers
+    ]
+    assert len(ranges) == (
+        download_hospital_datasets.RANGE_DOWNLOAD_PARTS if accept_ranges else 0
+    )
+    # If the server ignores range requests, the download is then requested
+    # in full
+    assert [method for method, _, _, _ in server.requests].count("GET") == len(
+        ranges
+    ) + (not honor_ranges)
+
+
+def test_download_hospital_dataset(
+    tmp_path: Path, local_client: Client
+) -> None:
+    """
+    Test that a dataset is written to a temporary file (overwriting one
+    left by an interrupted run), which then replaces the previous download.
+    """
+    path: Path = tmp_path / "hospitals.csv"
+    path.write_bytes(b"previous\r\n")
+    temp_path: Path = tmp_path / ".hospitals.csv.part"
+    temp_path.write_bytes(b"interrupted " * 1000)
+    assert download_hospital_datasets.download_hospital_dataset(
+        DOWNLOAD_URL, tmp_path, local_client
+    ) == {"ETag": ETAG}
+    assert [path.name for path in tmp_path.iterdir()] == ["hospitals.csv"]
+    lines: list[str] = path.read_text().splitlines()
+    assert lines[0] == '"facility_id","facility_name"'
+    assert lines[1] == '"000000","Example Hospital 0"'
+    assert len(lines) == 101  # noqa: PLR2004
+
+
+def test_download_hospital_dataset_error(
+    tmp_path: Path, server: LocalServer, local_client: Client
+) -> None:
+    """
+    Test that a download which fails leaves neither a temporary file, nor a
+    partial dataset in place of the previous download.
+    """
+    server.respond = partial(
+        respond_download, body=CSV_BODY + b"010002,Extra,Column\r\n"
+    )
+    path: Path = tmp_path / "hospitals.csv"
+    path.write_bytes(b"previous\r\n")
+    with pytest.raises(ValueError, match="columns"):
+        download_hospital_datasets.download_hospital_dataset(
+            DOWNLOAD_URL, tmp_path, local_client
+        )
+    assert [path.name for path in tmp_path.iterdir()] == ["hospitals.csv"]
+    assert path.read_bytes() == b"previous\r\n"
+
+
+def test_download_hospital_dataset_not_modified(
+    tmp_path: Path, server: LocalServer, local_client: Client
+) -> None:
+    """
+    Test that nothing is downloaded (or written) if the dataset has not been
+    modified since the validators were obtained.
+    """
+    assert download_hospital_datasets.download_hospital_dataset(
+        DOWNLOAD_URL, tmp_path, local_client, {"ETag": ETAG}
+    ) == {"ETag": ETAG}
+    assert not list(tmp_path.iterdir())
+    assert [method for method, _, _, _ in server.requests] == ["HEAD"]
+
+
+class _FailingIO(BytesIO):
+    """
+    A stream which raises an error once all of its data has been read.
+    """
+
+    def read(self, size: int | None = -1) -> bytes:
+        data: bytes = super().read(size)
+        if not data:
+            message: str = "The connection was reset."
+            raise ConnectionResetError(message)
+        return data
+
+
+@pytest.fixture(name="small_read_ahead")
+def get_small_read_ahead(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(download_hospital_datasets, "READ_AHEAD_CHUNK_SIZE", 7)
+    monkeypatch.setattr(download_hospital_datasets, "READ_AHEAD_CHUNKS", 2)
+
+
+@pytest.mark.usefixtures("small_read_ahead")
+def test_read_ahead_io() -> None:
+    """
+    Test that data read ahead is returned in order, and that EOF is
+    returned for every read once the source is exhausted.
+    """
+    source: BytesIO = BytesIO(CSV_BODY)
+    read_ahead_io: BufferedReader
+    with BufferedReader(
+        download_hospital_datasets.ReadAheadIO(source), buffer_size=5
+    ) as read_ahead_io:
+        assert read_ahead_io.read(3) == CSV_BODY[:3]
+        assert read_ahead_io.read() == CSV_BODY[3:]
+        assert read_ahead_io.read() == b""
+        assert read_ahead_io.read(1) == b""
+    assert source.closed
+
+
+@pytest.mark.usefixtures("small_read_ahead")
+def test_read_ahead_io_error() -> None:
+    """
+    Test that an error reading the source is raised by the reading thread,
+    after the data read before it, and by any subsequent reads.
+    """
+    read_ahead_io: typing.Any = download_hospital_datasets.ReadAheadIO(
+        _FailingIO(CSV_BODY)
+    )
+    with read_ahead_io:
+        data: bytearray = bytearray()
+        buffer: bytearray = bytearray(5)
+        with pytest.raises(ConnectionResetError):
+            while True:
+                data += buffer[: read_ahead_io.readinto(buffer)]
+        assert data == CSV_BODY
+        with pytest.raises(ConnectionResetError):
+            read_ahead_io.readinto(buffer)
+
+
+@pytest.mark.usefixtures("small_read_ahead")
+def test_read_ahead_io_close() -> None:
+    """
+    Test that closing a stream before it has been read in full stops the
+    background thread (which is blocked, once its queue is full), and closes
+    the source.
+    """
+    source: BytesIO = BytesIO(CSV_BODY)
+    read_ahead_io: typing.Any = download_hospital_datasets.ReadAheadIO(source)
+    assert read_ahead_io.read(1) == CSV_BODY[:1]
+    read_ahead_io.close()
+    assert source.closed
+    assert not read_ahead_io._thread.is_alive()  # noqa: SLF001
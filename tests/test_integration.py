@@ -1,8 +1,12 @@
+from __future__ import annotations
+
+import asyncio
 from typing import TYPE_CHECKING
 
 import pytest
 import sob
 
+from cms_gov_provider_data_sdk.async_client import AsyncClient
 from cms_gov_provider_data_sdk.client import Client
 
 if TYPE_CHECKING:
@@ -20,5 +24,19 @@ def test_client_get_provider_data_api_1_metastore_schemas_dataset_items(
     sob.model.validate(datasets)
 
 
+def test_async_client_get_metastore_schemas_dataset_items() -> None:
+    """
+    Test an asynchronous GET request to
+    https://data.cms.gov/provider-data/api/1/metastore/schemas/dataset/items
+    """
+
+    async def get_datasets() -> Datasets:
+        async_client: AsyncClient
+        async with AsyncClient(echo=False) as async_client:
+            return await async_client.get_metastore_schemas_dataset_items()
+
+    sob.model.validate(asyncio.run(get_datasets()))
+
+
 if __name__ == "__main__":
     pytest.main(["tests/test_integration.py"])